@@ -5,23 +5,73 @@ A Python client library for interacting with the Firefly III personal finance AP
 Supports account management and transaction creation using Personal Access Tokens.
 """
 
+import asyncio
+import atexit
+import gzip
 import logging
+import threading
+import time
+import weakref
 from datetime import date as Date
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+import ijson
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    model_serializer,
+    model_validator,
+)
 
 # Default values
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CURRENCY = "USD"
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=300
+)
+# Request bodies smaller than this are never compressed
+GZIP_MIN_SIZE = 1024
+# Transient failures: connection attempts are retried by the transport,
+# throttled or temporarily unavailable responses by the clients
+CONNECT_RETRIES = 3
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 30.0
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Amounts and dates are sent to Firefly III as strings
+DecimalString = Annotated[Decimal, PlainSerializer(str, return_type=str)]
+IsoDate = Annotated[Date, PlainSerializer(Date.isoformat, return_type=str)]
+
 
 class AccountType(str, Enum):
     """Firefly III Account Types based on API specification."""
@@ -64,7 +114,7 @@ class FireflyAPIError(Exception):
 class AccountAttributes(BaseModel):
     """Account attributes from Firefly III API."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", use_enum_values=True)
 
     name: str
     type: AccountType
@@ -110,14 +160,40 @@ class AccountsList(BaseModel):
     links: Optional[Dict[str, Any]] = None
 
 
+class TransactionExtras(BaseModel):
+    """Rarely used SEPA, bunq and auxiliary date fields of a transaction split."""
+
+    model_config = ConfigDict(extra="allow")
+
+    bunq_payment_id: Optional[str] = None
+    import_hash_v2: Optional[str] = None
+    sepa_cc: Optional[str] = None
+    sepa_ct_op: Optional[str] = None
+    sepa_ct_id: Optional[str] = None
+    sepa_db: Optional[str] = None
+    sepa_country: Optional[str] = None
+    sepa_ep: Optional[str] = None
+    sepa_ci: Optional[str] = None
+    sepa_batch_id: Optional[str] = None
+    interest_date: Optional[IsoDate] = None
+    book_date: Optional[IsoDate] = None
+    process_date: Optional[IsoDate] = None
+    due_date: Optional[IsoDate] = None
+    payment_date: Optional[IsoDate] = None
+    invoice_date: Optional[IsoDate] = None
+
+
+_EXTRAS_FIELDS = frozenset(TransactionExtras.model_fields)
+
+
 class TransactionSplit(BaseModel):
     """Individual transaction split within a transaction."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", use_enum_values=True)
 
     type: TransactionType
-    date: Date
-    amount: Decimal
+    date: IsoDate
+    amount: DecimalString
     description: str
     source_id: Optional[int] = None
     source_name: Optional[str] = None
@@ -142,42 +218,52 @@ class TransactionSplit(BaseModel):
     external_url: Optional[str] = None
     original_source: Optional[str] = None
     recurrence_id: Optional[int] = None
-    bunq_payment_id: Optional[str] = None
-    import_hash_v2: Optional[str] = None
-    sepa_cc: Optional[str] = None
-    sepa_ct_op: Optional[str] = None
-    sepa_ct_id: Optional[str] = None
-    sepa_db: Optional[str] = None
-    sepa_country: Optional[str] = None
-    sepa_ep: Optional[str] = None
-    sepa_ci: Optional[str] = None
-    sepa_batch_id: Optional[str] = None
-    interest_date: Optional[Date] = None
-    book_date: Optional[Date] = None
-    process_date: Optional[Date] = None
-    due_date: Optional[Date] = None
-    payment_date: Optional[Date] = None
-    invoice_date: Optional[Date] = None
-
-    @field_serializer("amount")
-    def serialize_amount(self, amount: Decimal) -> str:
-        """Convert Decimal amount to string for JSON serialization."""
-        return str(amount)
-
-    @field_serializer(
-        "date",
-        "interest_date",
-        "book_date",
-        "process_date",
-        "due_date",
-        "payment_date",
-        "invoice_date",
-    )
-    def serialize_date(self, date_value: Optional[Date]) -> Optional[str]:
-        """Convert Date objects to ISO format strings for JSON serialization."""
-        if date_value is None:
-            return None
-        return date_value.isoformat()
+    extras: Optional[TransactionExtras] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_extras(cls, data: Any) -> Any:
+        """Move SEPA, bunq and auxiliary date fields into the extras sub-model."""
+        if not isinstance(data, dict) or not _EXTRAS_FIELDS.intersection(data):
+            return data
+        data = dict(data)
+        extras = data.get("extras") or {}
+        if isinstance(extras, TransactionExtras):
+            extras = extras.model_dump(exclude_none=True)
+        extras = {**extras}
+        for name in _EXTRAS_FIELDS.intersection(data):
+            extras[name] = data.pop(name)
+        data["extras"] = extras
+        return data
+
+    @model_serializer(mode="wrap")
+    def flatten_extras(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Dict[str, Any]:
+        """Serialize extras as top-level fields, matching the Firefly III payload."""
+        data = handler(self)
+        extras = data.pop("extras", None)
+        if extras:
+            data.update(extras)
+        elif not info.exclude_none:
+            data.update(dict.fromkeys(TransactionExtras.model_fields))
+        return data
+
+
+def _extras_property(name: str) -> property:
+    """Read-only split attribute forwarding to the extras sub-model."""
+
+    def get(self: TransactionSplit) -> Any:
+        return None if self.extras is None else getattr(self.extras, name)
+
+    get.__name__ = name
+    get.__doc__ = f"The {name} field from extras, None when unset."
+    return property(get)
+
+
+# Keep split.interest_date, split.sepa_cc etc. readable as before
+for _name in TransactionExtras.model_fields:
+    setattr(TransactionSplit, _name, _extras_property(_name))
 
 
 class TransactionAttributes(BaseModel):
@@ -201,6 +287,10 @@ class TransactionStore(BaseModel):
     transactions: List[TransactionSplit]
 
 
+# Serializes request bodies straight to JSON bytes
+_TRANSACTION_STORE_ADAPTER = TypeAdapter(TransactionStore)
+
+
 class Transaction(BaseModel):
     """Firefly III Transaction model."""
 
@@ -219,11 +309,484 @@ class TransactionResponse(BaseModel):
     links: Optional[Dict[str, Any]] = None
 
 
-class FireflyClient:
+def _construct_split(
+    transaction_type: TransactionType,
+    date: Date,
+    amount: Union[str, float, Decimal],
+    description: str,
+    **fields: Any,
+) -> TransactionSplit:
+    """Build a split from the typed arguments of the create_* helpers.
+
+    Validation is skipped when the arguments already have their model types;
+    anything else (date strings, unknown or extras fields, malformed amounts)
+    goes through the validating constructor.
+    """
+    if type(date) is Date and not fields.keys() - TransactionSplit.model_fields.keys():
+        try:
+            amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+        except InvalidOperation:
+            pass
+        else:
+            return TransactionSplit.model_construct(
+                type=transaction_type.value,
+                date=date,
+                amount=amount,
+                description=description,
+                **fields,
+            )
+    return TransactionSplit(
+        type=transaction_type,
+        date=date,
+        amount=amount,
+        description=description,
+        **fields,
+    )
+
+
+def _construct_account(data: Dict[str, Any]) -> Account:
+    """Build an Account from trusted API data without validation."""
+    return Account.model_construct(
+        **{
+            **data,
+            "id": int(data["id"]),
+            "attributes": AccountAttributes.model_construct(**data["attributes"]),
+        }
+    )
+
+
+def _construct_accounts_list(data: Dict[str, Any]) -> AccountsList:
+    """Build an AccountsList from trusted API data without validation."""
+    return AccountsList.model_construct(
+        **{**data, "data": [_construct_account(account) for account in data["data"]]}
+    )
+
+
+def _construct_transaction_response(data: Dict[str, Any]) -> TransactionResponse:
+    """Build a TransactionResponse from trusted API data.
+
+    Only the envelope is constructed; splits are still validated because their
+    amounts, dates and ids arrive as strings and need coercing.
+    """
+    transaction = data["data"]
+    attributes = transaction["attributes"]
+    return TransactionResponse.model_construct(
+        **{
+            **data,
+            "data": Transaction.model_construct(
+                **{
+                    **transaction,
+                    "id": int(transaction["id"]),
+                    "attributes": TransactionAttributes.model_construct(
+                        **{
+                            **attributes,
+                            "transactions": [
+                                TransactionSplit.model_validate(split)
+                                for split in attributes["transactions"]
+                            ],
+                        }
+                    ),
+                }
+            ),
+        }
+    )
+
+
+def _transport() -> httpx.HTTPTransport:
+    """HTTP/2 pooled transport that retries failed connection attempts."""
+    return httpx.HTTPTransport(
+        http2=True, limits=DEFAULT_LIMITS, retries=CONNECT_RETRIES
+    )
+
+
+def _async_transport() -> httpx.AsyncHTTPTransport:
+    """Async counterpart of _transport()."""
+    return httpx.AsyncHTTPTransport(
+        http2=True, limits=DEFAULT_LIMITS, retries=CONNECT_RETRIES
+    )
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a transient error response, or None.
+
+    Retry-After is honoured when given in seconds; otherwise the delay backs
+    off exponentially. Delays are capped at MAX_RETRY_DELAY.
+    """
+    if response.status_code not in RETRY_STATUS_CODES or attempt >= MAX_RETRIES:
+        return None
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = 0.5 * 2**attempt
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    """Hashable cache key for a set of query parameters."""
+    return tuple(sorted(params.items())) if params else ()
+
+
+class _FireflyClientBase:
+    """
+    Shared configuration and request handling for the Firefly III clients.
+
+    Subclasses own the HTTP client and perform the actual I/O; everything that
+    does not touch the network (header setup, response handling, payload and
+    split construction) lives here so the sync and async clients stay in step.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        access_token: str,
+        trust_api: bool = True,
+        compress_requests: bool = False,
+    ):
+        self.host = host
+        self.access_token = access_token
+        self.trust_api = trust_api
+        self.compress_requests = compress_requests
+
+        if not self.host:
+            raise ValueError("Firefly III host must be provided")
+
+        if not self.access_token:
+            raise ValueError("Access token must be provided")
+
+        # Ensure host doesn't end with slash
+        self.host = self.host.rstrip("/")
+        self.base_url = f"{self.host}/api/v1"
+        self._auth_header = f"Bearer {self.access_token}"
+
+        # Store options shared by every store_transaction_fast() body
+        self._transaction_template: Dict[str, Any] = {
+            "error_if_duplicate_hash": True,
+            "apply_rules": True,
+            "fire_webhooks": True,
+        }
+
+        # Last accounts list per query, with the ETag it was served with
+        self._accounts_cache: Dict[
+            Tuple[Tuple[str, Any], ...], Tuple[str, AccountsList]
+        ] = {}
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request."""
+        return {
+            "Authorization": self._auth_header,
+            "Accept": "application/vnd.api+json",
+            "Content-Type": "application/json",
+        }
+
+    def _request_target(
+        self, endpoint: str, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        URL and headers for a request to endpoint.
+
+        A caller-provided HTTP client may be shared between Firefly III
+        instances, so it is left untouched and each request carries the
+        absolute URL and this instance's headers instead. Extra headers are
+        sent on top of the client's.
+        """
+        if self._owns_client:
+            target = {"url": endpoint}
+            if headers:
+                target["headers"] = headers
+            return target
+        if headers:
+            return {
+                "url": f"{self.base_url}{endpoint}",
+                "headers": {**self._headers, **headers},
+            }
+        return {"url": f"{self.base_url}{endpoint}", "headers": self._headers}
+
+    @staticmethod
+    def _request_body(data: Optional[Dict], content: Optional[bytes]) -> Dict[str, Any]:
+        """Keyword arguments carrying the request body for httpx."""
+        if content is None and data is not None:
+            content = orjson.dumps(data, default=str)
+        if content is not None:
+            return {"content": content}
+        return {}
+
+    def _request_kwargs(
+        self,
+        endpoint: str,
+        data: Optional[Dict],
+        content: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+    ) -> Dict[str, Any]:
+        """URL, headers and body keyword arguments for a request to endpoint."""
+        body = self._request_body(data, content)
+        if self.compress_requests and len(body.get("content", b"")) >= GZIP_MIN_SIZE:
+            # Level 1 is close to memcpy speed and still shrinks the highly
+            # repetitive JSON of multi-split transactions several times over
+            body["content"] = gzip.compress(body["content"], compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        return {**self._request_target(endpoint, headers), **body}
+
+    def _raise_for_error(
+        self, method: str, endpoint: str, response: httpx.Response
+    ) -> None:
+        """
+        Raise FireflyAPIError for error responses.
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        # Log request details for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s -> %s", method, endpoint, response.status_code)
+
+        if response.status_code >= 400:
+            error_message = f"HTTP {response.status_code}"
+            error_data = None
+
+            try:
+                error_data = orjson.loads(response.content)
+                if "message" in error_data:
+                    error_message = error_data["message"]
+                elif "error" in error_data:
+                    error_message = error_data["error"]
+            except Exception:
+                error_message = response.text or error_message
+
+            raise FireflyAPIError(
+                message=error_message,
+                status_code=response.status_code,
+                response_data=error_data,
+            )
+
+    def _handle_response(
+        self, method: str, endpoint: str, response: httpx.Response
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Turn an HTTP response into decoded JSON data.
+
+        Returns:
+            JSON response data, or None for successful responses with no content
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        self._raise_for_error(method, endpoint, response)
+
+        # Successful responses may have no content (e.g., DELETE operations)
+        content = response.content
+        if response.status_code == 204 or not content:
+            return None
+
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Whitespace-only or non-JSON bodies on success are treated as empty
+            return None
+
+    def _accounts_request_headers(
+        self, params: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """Conditional GET headers for an accounts query seen before."""
+        cached = self._accounts_cache.get(_params_key(params))
+        if cached is None:
+            return None
+        return {"If-None-Match": cached[0]}
+
+    def _accounts_from_response(
+        self, params: Optional[Dict[str, Any]], response: httpx.Response
+    ) -> AccountsList:
+        """
+        Parse an accounts list response, honouring conditional GETs.
+
+        A 304 answer returns the cached list. Otherwise the new list is
+        cached together with its ETag when the server sent one.
+        """
+        key = _params_key(params)
+        if response.status_code == 304 and key in self._accounts_cache:
+            return self._accounts_cache[key][1]
+
+        accounts = self._parse_typed_response(
+            "GET", "/accounts", response, AccountsList, _construct_accounts_list
+        )
+        etag = response.headers.get("ETag")
+        if etag:
+            self._accounts_cache[key] = (etag, accounts)
+        else:
+            self._accounts_cache.pop(key, None)
+        return accounts
+
+    def _parse_typed_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: httpx.Response,
+        model: Type[ModelT],
+        construct: Callable[[Dict[str, Any]], ModelT],
+    ) -> ModelT:
+        """
+        Parse a response body into a response model.
+
+        Trusted bodies are decoded with orjson and built by construct without
+        validation. Otherwise the raw bytes are parsed and validated in a
+        single pydantic-core pass, without an intermediate dict.
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        self._raise_for_error(method, endpoint, response)
+        if self.trust_api:
+            return construct(orjson.loads(response.content))
+        return model.model_validate_json(response.content)
+
+    def _parse_account(self, data: Dict[str, Any]) -> Account:
+        """Parse a single account response."""
+        return self._parse_account_item(data["data"])
+
+    def _parse_account_item(self, item: Dict[str, Any]) -> Account:
+        """Parse one account resource object."""
+        if self.trust_api:
+            return _construct_account(item)
+        return Account(**item)
+
+    @staticmethod
+    def _accounts_params(
+        type_filter: Optional[str], page: Optional[int], limit: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """Query parameters for the accounts list endpoint, None if unfiltered."""
+        if not type_filter and page is None and limit is None:
+            return None
+        params = {}
+        if type_filter:
+            params["type"] = type_filter
+        if page is not None:
+            params["page"] = page
+        if limit is not None:
+            params["limit"] = limit
+        return params
+
+    @staticmethod
+    def _transaction_store_body(
+        transactions: List[TransactionSplit],
+        group_title: Optional[str],
+        error_if_duplicate_hash: bool,
+        apply_rules: bool,
+        fire_webhooks: bool,
+    ) -> bytes:
+        """Serialized request body for storing a transaction group."""
+        # The splits are already validated models and the flags are plain
+        # values, so the wrapper is built without another validation pass
+        transaction_data = TransactionStore.model_construct(
+            error_if_duplicate_hash=error_if_duplicate_hash,
+            apply_rules=apply_rules,
+            fire_webhooks=fire_webhooks,
+            group_title=group_title,
+            transactions=list(transactions),
+        )
+        return _TRANSACTION_STORE_ADAPTER.dump_json(transaction_data, exclude_none=True)
+
+    def _transaction_fast_body(
+        self, transactions: List[Dict[str, Any]], group_title: Optional[str]
+    ) -> bytes:
+        """Serialized store body for pre-built split dicts."""
+        body = self._transaction_template | {"transactions": transactions}
+        if group_title is not None:
+            body["group_title"] = group_title
+        return orjson.dumps(body)
+
+    @staticmethod
+    def _withdrawal_split(
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_id: int,
+        destination_account_id: int,
+        date: Optional[Date],
+        category_name: Optional[str],
+        budget_name: Optional[str],
+        notes: Optional[str],
+        tags: Optional[List[str]],
+    ) -> TransactionSplit:
+        """Build the split for a withdrawal transaction."""
+        if date is None:
+            date = datetime.now().date()
+
+        return _construct_split(
+            TransactionType.WITHDRAWAL,
+            date,
+            amount,
+            description,
+            source_id=source_account_id,
+            destination_id=destination_account_id,
+            category_name=category_name,
+            budget_name=budget_name,
+            notes=notes,
+            tags=tags,
+        )
+
+    @staticmethod
+    def _deposit_split(
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_name: str,
+        destination_account_id: int,
+        date: Optional[Date],
+        category_name: Optional[str],
+        notes: Optional[str],
+        tags: Optional[List[str]],
+        **kwargs,
+    ) -> TransactionSplit:
+        """Build the split for a deposit transaction."""
+        if date is None:
+            date = datetime.now().date()
+
+        return _construct_split(
+            TransactionType.DEPOSIT,
+            date,
+            amount,
+            description,
+            source_name=source_account_name,
+            destination_id=destination_account_id,
+            category_name=category_name,
+            notes=notes,
+            tags=tags,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _transfer_split(
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_id: int,
+        destination_account_id: int,
+        date: Optional[Date],
+        notes: Optional[str],
+        tags: Optional[List[str]],
+        **kwargs,
+    ) -> TransactionSplit:
+        """Build the split for a transfer transaction."""
+        if date is None:
+            date = datetime.now().date()
+
+        return _construct_split(
+            TransactionType.TRANSFER,
+            date,
+            amount,
+            description,
+            source_id=source_account_id,
+            destination_id=destination_account_id,
+            notes=notes,
+            tags=tags,
+            **kwargs,
+        )
+
+
+class FireflyClient(_FireflyClientBase):
     """
     Firefly III API Client
 
     A client for interacting with the Firefly III REST API using Personal Access Tokens.
+    Requests use HTTP/2 when the server negotiates it over TLS and fall back to
+    HTTP/1.1 keep-alive connections otherwise.
     """
 
     def __init__(
@@ -232,6 +795,8 @@ class FireflyClient:
         access_token: str,
         timeout: float = DEFAULT_TIMEOUT,
         httpx_client: Optional[httpx.Client] = None,
+        trust_api: bool = True,
+        compress_requests: bool = False,
     ):
         """
         Initialize the Firefly III client.
@@ -240,41 +805,29 @@ class FireflyClient:
             host: Firefly III host URL.
             access_token: Personal Access Token.
             timeout: HTTP request timeout in seconds.
-            httpx_client: Optional pre-configured httpx.Client instance.
+            httpx_client: Optional pre-configured httpx.Client instance. The
+                caller remains responsible for closing it.
+            trust_api: Build response models without re-validating the API data.
+                Set to False to validate every response.
+            compress_requests: Gzip request bodies of GZIP_MIN_SIZE bytes or
+                more. Only enable this when the web server in front of
+                Firefly III decodes gzip-encoded request bodies.
         """
-        self.host = host
-        self.access_token = access_token
-
-        if not self.host:
-            raise ValueError("Firefly III host must be provided")
-
-        if not self.access_token:
-            raise ValueError("Access token must be provided")
+        super().__init__(host, access_token, trust_api, compress_requests)
 
-        # Ensure host doesn't end with slash
-        self.host = self.host.rstrip("/")
+        # Only close the HTTP client on exit if we created it
+        self._owns_client = httpx_client is None
 
         # Set up HTTP client with default headers
         if httpx_client is not None:
             self.client = httpx_client
-            # Update the base URL and headers for the provided client
-            self.client.base_url = f"{self.host}/api/v1"
-            self.client.headers.update(
-                {
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Accept": "application/vnd.api+json",
-                    "Content-Type": "application/json",
-                }
-            )
+            self._headers = self._default_headers()
         else:
             self.client = httpx.Client(
+                transport=_transport(),
                 timeout=timeout,
-                base_url=f"{self.host}/api/v1",
-                headers={
-                    "Authorization": f"Bearer {self.access_token}",
-                    "Accept": "application/vnd.api+json",
-                    "Content-Type": "application/json",
-                },
+                base_url=self.base_url,
+                headers=self._default_headers(),
             )
 
     def __enter__(self):
@@ -284,8 +837,9 @@ class FireflyClient:
         self.close()
 
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client, unless it was provided by the caller."""
+        if self._owns_client:
+            self.client.close()
 
     def _make_request(
         self,
@@ -293,15 +847,17 @@ class FireflyClient:
         endpoint: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        content: Optional[bytes] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Make an HTTP request to the Firefly III API.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            endpoint: API endpoint path, relative to the client's base URL
             data: Request body data for POST/PUT requests
             params: Query parameters
+            content: Pre-serialized JSON request body, sent as-is instead of data
 
         Returns:
             JSON response data, or None for successful responses with no content
@@ -309,50 +865,53 @@ class FireflyClient:
         Raises:
             FireflyAPIError: If the API returns an error
         """
-        url = f"{self.host}/api/v1{endpoint}"
+        response = self._send(method, endpoint, data, params, content)
+        return self._handle_response(method, endpoint, response)
 
-        try:
-            response = self.client.request(
-                method=method, url=url, json=data, params=params
-            )
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None,
+    ) -> httpx.Response:
+        """
+        Send a request and return the raw response; see _make_request.
 
-            # Log request details for debugging
-            logger.debug(f"{method} {url} -> {response.status_code}")
-
-            if response.status_code >= 400:
-                error_message = f"HTTP {response.status_code}"
-                error_data = None
-
-                try:
-                    error_data = response.json()
-                    if "message" in error_data:
-                        error_message = error_data["message"]
-                    elif "error" in error_data:
-                        error_message = error_data["error"]
-                except Exception:
-                    error_message = response.text or error_message
-
-                raise FireflyAPIError(
-                    message=error_message,
-                    status_code=response.status_code,
-                    response_data=error_data,
+        When retry is true, throttled (429) and temporarily unavailable
+        (502-504) responses are retried up to MAX_RETRIES times. retry defaults
+        to true for idempotent methods only; other requests may only be
+        retried when the server rejects duplicates.
+        """
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        request_kwargs = self._request_kwargs(endpoint, data, content, headers)
+        attempt = 0
+        while True:
+            try:
+                response = self.client.request(
+                    method=method, params=params, **request_kwargs
                 )
-
-            # Handle successful responses that may have empty content (e.g., DELETE operations)
-            if response.content.strip():
-                try:
-                    return response.json()
-                except Exception:
-                    # If JSON parsing fails but status is successful, return None
-                    return None
-            else:
-                # Empty response body - return None for successful operations
-                return None
-
-        except httpx.RequestError as e:
-            raise FireflyAPIError(f"Request failed: {str(e)}")
-        except httpx.TimeoutException:
-            raise FireflyAPIError("Request timed out")
+            except httpx.RequestError as e:
+                raise FireflyAPIError(f"Request failed: {str(e)}")
+            except httpx.TimeoutException:
+                raise FireflyAPIError("Request timed out")
+
+            delay = _retry_delay(response, attempt) if retry else None
+            if delay is None:
+                return response
+            logger.warning(
+                "%s %s -> %s, retrying in %.1fs",
+                method,
+                endpoint,
+                response.status_code,
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
 
     def get_accounts(
         self,
@@ -369,18 +928,63 @@ class FireflyClient:
             limit: Number of accounts per page
 
         Returns:
-            AccountsList object containing account data
+            AccountsList object containing account data. Repeated queries are
+            sent as conditional GETs; when the server answers 304 Not Modified
+            the previously returned AccountsList is returned again.
         """
-        params = {}
-        if type_filter:
-            params["type"] = type_filter
-        if page is not None:
-            params["page"] = page
-        if limit is not None:
-            params["limit"] = limit
+        params = self._accounts_params(type_filter, page, limit)
+        response = self._send(
+            "GET",
+            "/accounts",
+            params=params,
+            headers=self._accounts_request_headers(params),
+        )
+        return self._accounts_from_response(params, response)
+
+    def iter_accounts(
+        self,
+        type_filter: Optional[str] = None,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Account]:
+        """
+        Stream accounts from Firefly III one at a time.
+
+        The response body is parsed incrementally while it downloads, so memory
+        stays flat for large account lists. Use get_accounts() for the eager API.
+
+        Args:
+            type_filter: Filter by account type (asset, expense, revenue, liability, etc.)
+            page: Page number for pagination
+            limit: Number of accounts per page
+
+        Yields:
+            Account objects in the order returned by the API
 
-        response_data = self._make_request("GET", "/accounts", params=params)
-        return AccountsList(**response_data)
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        params = self._accounts_params(type_filter, page, limit)
+        try:
+            with self.client.stream(
+                "GET", params=params, **self._request_target("/accounts")
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    self._raise_for_error("GET", "/accounts", response)
+
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "data.item", use_float=True)
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        yield self._parse_account_item(item)
+                    del items[:]
+                parser.close()
+                for item in items:
+                    yield self._parse_account_item(item)
+        except httpx.RequestError as e:
+            raise FireflyAPIError(f"Request failed: {str(e)}")
 
     def get_account(self, account_id: int) -> Account:
         """
@@ -393,7 +997,7 @@ class FireflyClient:
             Account object
         """
         response_data = self._make_request("GET", f"/accounts/{account_id}")
-        return Account(**response_data["data"])
+        return self._parse_account(response_data)
 
     def store_transaction(
         self,
@@ -411,21 +1015,90 @@ class FireflyClient:
             group_title: Optional title for the transaction group
             error_if_duplicate_hash: Whether to error if duplicate hash detected
             apply_rules: Whether to apply rules to the transaction
-            fire_webhooks: Whether to fire webhooks for the transaction        Returns:
+            fire_webhooks: Whether to fire webhooks for the transaction
+
+        Returns:
             TransactionResponse object containing the created transaction
         """
-        transaction_data = TransactionStore(
-            error_if_duplicate_hash=error_if_duplicate_hash,
-            apply_rules=apply_rules,
-            fire_webhooks=fire_webhooks,
-            group_title=group_title,
-            transactions=transactions,
+        content = self._transaction_store_body(
+            transactions,
+            group_title,
+            error_if_duplicate_hash,
+            apply_rules,
+            fire_webhooks,
         )
+        response = self._send(
+            "POST", "/transactions", content=content, retry=error_if_duplicate_hash
+        )
+        return self._parse_typed_response(
+            "POST",
+            "/transactions",
+            response,
+            TransactionResponse,
+            _construct_transaction_response,
+        )
+
+    def store_transaction_fast(
+        self, transactions: List[Dict[str, Any]], group_title: Optional[str] = None
+    ) -> TransactionResponse:
+        """
+        Store a new transaction from splits given as plain dicts.
 
-        response_data = self._make_request(
-            "POST", "/transactions", data=transaction_data.model_dump(exclude_none=True)
+        The splits are sent as-is, without TransactionSplit validation or
+        serialization, so they must already be in Firefly III's wire format
+        (amounts and dates as strings, no None values). Intended for bulk
+        imports of trusted data; duplicate hashes are rejected and rules and
+        webhooks apply, as with store_transaction's defaults.
+
+        Args:
+            transactions: List of transaction splits in API format
+            group_title: Optional title for the transaction group
+
+        Returns:
+            TransactionResponse object containing the created transaction
+        """
+        content = self._transaction_fast_body(transactions, group_title)
+        response = self._send("POST", "/transactions", content=content, retry=True)
+        return self._parse_typed_response(
+            "POST",
+            "/transactions",
+            response,
+            TransactionResponse,
+            _construct_transaction_response,
         )
-        return TransactionResponse(**response_data)
+
+    def store_transactions_bulk(
+        self,
+        groups: Mapping[str, List[TransactionSplit]],
+        error_if_duplicate_hash: bool = True,
+        apply_rules: bool = True,
+        fire_webhooks: bool = True,
+    ) -> List[TransactionResponse]:
+        """
+        Store several transaction groups, one request per group.
+
+        All splits sharing a group title are posted together as a single
+        multi-split transaction instead of one request per split.
+
+        Args:
+            groups: Transaction splits keyed by group title
+            error_if_duplicate_hash: Whether to error if duplicate hash detected
+            apply_rules: Whether to apply rules to the transactions
+            fire_webhooks: Whether to fire webhooks for the transactions
+
+        Returns:
+            One TransactionResponse per group, in the order of groups
+        """
+        return [
+            self.store_transaction(
+                transactions,
+                group_title,
+                error_if_duplicate_hash,
+                apply_rules,
+                fire_webhooks,
+            )
+            for group_title, transactions in groups.items()
+        ]
 
     def create_withdrawal(
         self,
@@ -458,20 +1131,16 @@ class FireflyClient:
         Returns:
             TransactionResponse object
         """
-        if date is None:
-            date = datetime.now().date()
-
-        transaction_split = TransactionSplit(
-            type=TransactionType.WITHDRAWAL,
-            date=date,
-            amount=amount,
-            description=description,
-            source_id=source_account_id,
-            destination_id=destination_account_id,
-            category_name=category_name,
-            budget_name=budget_name,
-            notes=notes,
-            tags=tags,
+        transaction_split = self._withdrawal_split(
+            amount,
+            description,
+            source_account_id,
+            destination_account_id,
+            date,
+            category_name,
+            budget_name,
+            notes,
+            tags,
         )
 
         return self.store_transaction([transaction_split], **kwargs)
@@ -505,19 +1174,15 @@ class FireflyClient:
         Returns:
             TransactionResponse object
         """
-        if date is None:
-            date = datetime.now().date()
-
-        transaction_split = TransactionSplit(
-            type=TransactionType.DEPOSIT,
-            date=date,
-            amount=amount,
-            description=description,
-            source_name=source_account_name,
-            destination_id=destination_account_id,
-            category_name=category_name,
-            notes=notes,
-            tags=tags,
+        transaction_split = self._deposit_split(
+            amount,
+            description,
+            source_account_name,
+            destination_account_id,
+            date,
+            category_name,
+            notes,
+            tags,
             **kwargs,
         )
 
@@ -550,18 +1215,14 @@ class FireflyClient:
         Returns:
             TransactionResponse object
         """
-        if date is None:
-            date = datetime.now().date()
-
-        transaction_split = TransactionSplit(
-            type=TransactionType.TRANSFER,
-            date=date,
-            amount=amount,
-            description=description,
-            source_id=source_account_id,
-            destination_id=destination_account_id,
-            notes=notes,
-            tags=tags,
+        transaction_split = self._transfer_split(
+            amount,
+            description,
+            source_account_id,
+            destination_account_id,
+            date,
+            notes,
+            tags,
             **kwargs,
         )
 
@@ -592,6 +1253,460 @@ class FireflyClient:
         self._make_request("DELETE", f"/transaction-journals/{transaction_journal_id}")
 
 
+class AsyncFireflyClient(_FireflyClientBase):
+    """
+    Asynchronous Firefly III API Client
+
+    Mirrors FireflyClient on top of httpx.AsyncClient. Requests are sent over
+    HTTP/2 with a keep-alive connection pool, so concurrent calls (for example
+    via asyncio.gather) share a single multiplexed connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        access_token: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        httpx_client: Optional[httpx.AsyncClient] = None,
+        trust_api: bool = True,
+        compress_requests: bool = False,
+    ):
+        """
+        Initialize the asynchronous Firefly III client.
+
+        Args:
+            host: Firefly III host URL.
+            access_token: Personal Access Token.
+            timeout: HTTP request timeout in seconds.
+            httpx_client: Optional pre-configured httpx.AsyncClient instance. The
+                caller remains responsible for closing it.
+            trust_api: Build response models without re-validating the API data.
+                Set to False to validate every response.
+            compress_requests: Gzip request bodies of GZIP_MIN_SIZE bytes or
+                more. Only enable this when the web server in front of
+                Firefly III decodes gzip-encoded request bodies.
+        """
+        super().__init__(host, access_token, trust_api, compress_requests)
+
+        # Only close the HTTP client on exit if we created it
+        self._owns_client = httpx_client is None
+
+        if httpx_client is not None:
+            self.client = httpx_client
+            self._headers = self._default_headers()
+        else:
+            self.client = httpx.AsyncClient(
+                transport=_async_transport(),
+                timeout=timeout,
+                base_url=self.base_url,
+                headers=self._default_headers(),
+            )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the HTTP client, unless it was provided by the caller."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        content: Optional[bytes] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make an HTTP request to the Firefly III API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path, relative to the client's base URL
+            data: Request body data for POST/PUT requests
+            params: Query parameters
+            content: Pre-serialized JSON request body, sent as-is instead of data
+
+        Returns:
+            JSON response data, or None for successful responses with no content
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        response = await self._send(method, endpoint, data, params, content)
+        return self._handle_response(method, endpoint, response)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: Optional[bool] = None,
+    ) -> httpx.Response:
+        """Send a request and return the raw response; see FireflyClient._send."""
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        request_kwargs = self._request_kwargs(endpoint, data, content, headers)
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(
+                    method=method, params=params, **request_kwargs
+                )
+            except httpx.RequestError as e:
+                raise FireflyAPIError(f"Request failed: {str(e)}")
+            except httpx.TimeoutException:
+                raise FireflyAPIError("Request timed out")
+
+            delay = _retry_delay(response, attempt) if retry else None
+            if delay is None:
+                return response
+            logger.warning(
+                "%s %s -> %s, retrying in %.1fs",
+                method,
+                endpoint,
+                response.status_code,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_accounts(
+        self,
+        type_filter: Optional[str] = None,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> AccountsList:
+        """
+        Retrieve all accounts from Firefly III.
+
+        Args:
+            type_filter: Filter by account type (asset, expense, revenue, liability, etc.)
+            page: Page number for pagination
+            limit: Number of accounts per page
+
+        Returns:
+            AccountsList object containing account data. Repeated queries are
+            sent as conditional GETs; when the server answers 304 Not Modified
+            the previously returned AccountsList is returned again.
+        """
+        params = self._accounts_params(type_filter, page, limit)
+        response = await self._send(
+            "GET",
+            "/accounts",
+            params=params,
+            headers=self._accounts_request_headers(params),
+        )
+        return self._accounts_from_response(params, response)
+
+    async def get_account(self, account_id: int) -> Account:
+        """
+        Retrieve a specific account by ID.
+
+        Args:
+            account_id: The account ID
+
+        Returns:
+            Account object
+        """
+        response_data = await self._make_request("GET", f"/accounts/{account_id}")
+        return self._parse_account(response_data)
+
+    async def get_accounts_by_ids(self, account_ids: Iterable[int]) -> List[Account]:
+        """
+        Retrieve several accounts by ID concurrently.
+
+        The requests are issued together and multiplexed over the client's
+        HTTP/2 connection, so N lookups cost about one round trip.
+
+        Args:
+            account_ids: The account IDs
+
+        Returns:
+            Account objects in the order of account_ids
+
+        Raises:
+            FireflyAPIError: If any lookup fails
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_account(account_id) for account_id in account_ids)
+            )
+        )
+
+    async def store_transaction(
+        self,
+        transactions: List[TransactionSplit],
+        group_title: Optional[str] = None,
+        error_if_duplicate_hash: bool = True,
+        apply_rules: bool = True,
+        fire_webhooks: bool = True,
+    ) -> TransactionResponse:
+        """
+        Store a new transaction in Firefly III.
+
+        Args:
+            transactions: List of transaction splits
+            group_title: Optional title for the transaction group
+            error_if_duplicate_hash: Whether to error if duplicate hash detected
+            apply_rules: Whether to apply rules to the transaction
+            fire_webhooks: Whether to fire webhooks for the transaction
+
+        Returns:
+            TransactionResponse object containing the created transaction
+        """
+        content = self._transaction_store_body(
+            transactions,
+            group_title,
+            error_if_duplicate_hash,
+            apply_rules,
+            fire_webhooks,
+        )
+        response = await self._send(
+            "POST", "/transactions", content=content, retry=error_if_duplicate_hash
+        )
+        return self._parse_typed_response(
+            "POST",
+            "/transactions",
+            response,
+            TransactionResponse,
+            _construct_transaction_response,
+        )
+
+    async def store_transaction_fast(
+        self, transactions: List[Dict[str, Any]], group_title: Optional[str] = None
+    ) -> TransactionResponse:
+        """
+        Store a new transaction from splits given as plain dicts.
+
+        See FireflyClient.store_transaction_fast for the arguments.
+        """
+        content = self._transaction_fast_body(transactions, group_title)
+        response = await self._send(
+            "POST", "/transactions", content=content, retry=True
+        )
+        return self._parse_typed_response(
+            "POST",
+            "/transactions",
+            response,
+            TransactionResponse,
+            _construct_transaction_response,
+        )
+
+    async def store_transactions_bulk(
+        self,
+        groups: Mapping[str, List[TransactionSplit]],
+        error_if_duplicate_hash: bool = True,
+        apply_rules: bool = True,
+        fire_webhooks: bool = True,
+    ) -> List[TransactionResponse]:
+        """
+        Store several transaction groups concurrently, one request per group.
+
+        All splits sharing a group title are posted together as a single
+        multi-split transaction instead of one request per split.
+
+        Args:
+            groups: Transaction splits keyed by group title
+            error_if_duplicate_hash: Whether to error if duplicate hash detected
+            apply_rules: Whether to apply rules to the transactions
+            fire_webhooks: Whether to fire webhooks for the transactions
+
+        Returns:
+            One TransactionResponse per group, in the order of groups
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.store_transaction(
+                        transactions,
+                        group_title,
+                        error_if_duplicate_hash,
+                        apply_rules,
+                        fire_webhooks,
+                    )
+                    for group_title, transactions in groups.items()
+                )
+            )
+        )
+
+    async def create_withdrawal(
+        self,
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_id: int,
+        destination_account_id: int,
+        date: Optional[Date] = None,
+        category_name: Optional[str] = None,
+        budget_name: Optional[str] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> TransactionResponse:
+        """
+        Create a withdrawal transaction (expense).
+
+        See FireflyClient.create_withdrawal for the arguments.
+        """
+        transaction_split = self._withdrawal_split(
+            amount,
+            description,
+            source_account_id,
+            destination_account_id,
+            date,
+            category_name,
+            budget_name,
+            notes,
+            tags,
+        )
+
+        return await self.store_transaction([transaction_split], **kwargs)
+
+    async def create_deposit(
+        self,
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_name: str,
+        destination_account_id: int,
+        date: Optional[Date] = None,
+        category_name: Optional[str] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> TransactionResponse:
+        """
+        Create a deposit transaction (income).
+
+        See FireflyClient.create_deposit for the arguments.
+        """
+        transaction_split = self._deposit_split(
+            amount,
+            description,
+            source_account_name,
+            destination_account_id,
+            date,
+            category_name,
+            notes,
+            tags,
+            **kwargs,
+        )
+
+        return await self.store_transaction([transaction_split], **kwargs)
+
+    async def create_transfer(
+        self,
+        amount: Union[str, float, Decimal],
+        description: str,
+        source_account_id: int,
+        destination_account_id: int,
+        date: Optional[Date] = None,
+        notes: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        **kwargs,
+    ) -> TransactionResponse:
+        """
+        Create a transfer transaction between accounts.
+
+        See FireflyClient.create_transfer for the arguments.
+        """
+        transaction_split = self._transfer_split(
+            amount,
+            description,
+            source_account_id,
+            destination_account_id,
+            date,
+            notes,
+            tags,
+            **kwargs,
+        )
+
+        return await self.store_transaction([transaction_split], **kwargs)
+
+    async def delete_transaction(self, transaction_group_id: int) -> None:
+        """
+        Delete a transaction group by ID.
+
+        Args:
+            transaction_group_id: The ID of the transaction group to delete
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        await self._make_request("DELETE", f"/transactions/{transaction_group_id}")
+
+    async def delete_transaction_journal(self, transaction_journal_id: int) -> None:
+        """
+        Delete a specific transaction journal by ID.
+
+        Args:
+            transaction_journal_id: The ID of the transaction journal to delete
+
+        Raises:
+            FireflyAPIError: If the API returns an error
+        """
+        await self._make_request(
+            "DELETE", f"/transaction-journals/{transaction_journal_id}"
+        )
+
+
+# Process-wide connection pool shared by clients from create_client()
+_default_client: Optional[httpx.Client] = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> httpx.Client:
+    """Get the shared httpx.Client, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = httpx.Client(
+                    transport=_transport(), timeout=DEFAULT_TIMEOUT
+                )
+                atexit.register(_default_client.close)
+    return _default_client
+
+
+# Async connection pools shared by clients from create_async_client(). An
+# httpx.AsyncClient is bound to the event loop it first ran on, so there is
+# one pool per loop, closed by aclose_async_clients().
+_default_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def _get_default_async_client() -> httpx.AsyncClient:
+    """Get the shared httpx.AsyncClient of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            transport=_async_transport(), timeout=DEFAULT_TIMEOUT
+        )
+        _default_async_clients[loop] = client
+    return client
+
+
+async def aclose_async_clients() -> None:
+    """
+    Close the async connection pool shared on the running event loop.
+
+    Call this before the loop shuts down (for example at the end of main()
+    or in a server lifespan) to release the pool's connections. Clients
+    created afterwards on the same loop get a fresh pool.
+    """
+    client = _default_async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 # Convenience function for creating a client
 def create_client(
     host: str, access_token: str, httpx_client: Optional[httpx.Client] = None
@@ -599,6 +1714,9 @@ def create_client(
     """
     Create a Firefly III client instance.
 
+    Unless an httpx_client is given, the client uses a process-wide connection
+    pool, so TLS sessions and kept-alive connections are reused across clients.
+
     Args:
         host: Firefly III host URL.
         access_token: Personal Access Token.
@@ -607,6 +1725,73 @@ def create_client(
     Returns:
         FireflyClient instance
     """
+    if httpx_client is None:
+        httpx_client = _get_default_client()
     return FireflyClient(
         host=host, access_token=access_token, httpx_client=httpx_client
     )
+
+
+def create_async_client(
+    host: str, access_token: str, httpx_client: Optional[httpx.AsyncClient] = None
+) -> AsyncFireflyClient:
+    """
+    Create an asynchronous Firefly III client instance.
+
+    Unless an httpx_client is given, the client uses the connection pool shared
+    by all async clients on the running event loop, so concurrent requests
+    (for example via asyncio.gather) multiplex over the same HTTP/2
+    connections. Must be called from within a running event loop; close the
+    shared pool with aclose_async_clients() before the loop ends.
+
+    Args:
+        host: Firefly III host URL.
+        access_token: Personal Access Token.
+        httpx_client: Optional pre-configured httpx.AsyncClient instance.
+
+    Returns:
+        AsyncFireflyClient instance
+    """
+    if httpx_client is None:
+        httpx_client = _get_default_async_client()
+    return AsyncFireflyClient(
+        host=host, access_token=access_token, httpx_client=httpx_client
+    )
+
+
+# Long-lived clients handed out by get_client()
+_shared_clients: Dict[Tuple[str, str, float], FireflyClient] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_client(
+    host: str, access_token: str, timeout: float = DEFAULT_TIMEOUT
+) -> FireflyClient:
+    """
+    Get the process-wide Firefly III client for a host and token.
+
+    The client is created on first use and reused afterwards, so its HTTP/2
+    connection stays warm and its cached accounts list (revalidated with
+    ETags) is shared by all callers. It is closed when the process exits;
+    callers must not close it themselves.
+
+    Args:
+        host: Firefly III host URL.
+        access_token: Personal Access Token.
+        timeout: HTTP request timeout in seconds.
+
+    Returns:
+        Shared FireflyClient instance
+    """
+    key = (host, access_token, timeout)
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = FireflyClient(
+                    host=host, access_token=access_token, timeout=timeout
+                )
+                atexit.register(client.close)
+                _shared_clients[key] = client
+    return client
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 
@@ -9,29 +10,96 @@ load_dotenv(Path(__file__).parent.parent / ".env")
 
 
 # Pytest fixtures and utilities
+def _first_active_account_id(accounts, account_type):
+    """Return the ID of the first active account of the given type."""
+    for account in accounts:
+        if account.attributes.type == account_type and account.attributes.active:
+            return account.id
+    pytest.skip("No accounts available for testing")
+
+
 @pytest.fixture
-def default_account_id(firefly_client):
-    """Fixture that provides the default account ID for testing."""
-    accounts = firefly_client.get_accounts(type_filter="asset")
-    accounts = [a for a in accounts.data if a.attributes.active]
-    if accounts:
-        return accounts[0].id
-    else:
-        pytest.skip("No accounts available for testing")
+def mock_client():
+    """Fixture that builds FireflyClients answered by a MockTransport handler."""
+    from firefly_client import FireflyClient
+
+    def make(handler, **kwargs):
+        return FireflyClient(
+            host="http://test.com",
+            access_token="test",
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            **kwargs,
+        )
+
+    return make
 
 
 @pytest.fixture
-def sample_expense_account_id(firefly_client):
-    """Fixture that provides a sample expense account ID for testing."""
-    accounts = firefly_client.get_accounts(type_filter="expense")
-    accounts = [a for a in accounts.data if a.attributes.active]
-    if accounts:
-        return accounts[0].id
-    else:
-        pytest.skip("No accounts available for testing")
+def store_client(mock_client):
+    """
+    Fixture that builds FireflyClients answering like a transaction store.
+
+    The factory returns the client and the list of requests it sent. Each
+    request is answered with an empty stored transaction whose ID is the
+    request's 1-based position, or, when statuses are given, with the status
+    at that position (the last one repeating) and a zero Retry-After.
+    """
+
+    def make(statuses=(200,), **kwargs):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            status = statuses[min(len(requests), len(statuses)) - 1]
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"})
+            return httpx.Response(
+                200,
+                json={
+                    "data": {"id": len(requests), "attributes": {"transactions": []}}
+                },
+            )
+
+        return mock_client(handler, **kwargs), requests
+
+    return make
 
 
 @pytest.fixture
+def mock_async_client():
+    """Fixture that builds AsyncFireflyClients answered by a MockTransport handler."""
+    from firefly_client import AsyncFireflyClient
+
+    def make(handler, **kwargs):
+        return AsyncFireflyClient(
+            host="http://test.com",
+            access_token="test",
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            **kwargs,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def firefly_accounts(firefly_client):
+    """Fixture that fetches the account list once per test session."""
+    return firefly_client.get_accounts().data
+
+
+@pytest.fixture(scope="session")
+def default_account_id(firefly_accounts):
+    """Fixture that provides the default account ID for testing."""
+    return _first_active_account_id(firefly_accounts, "asset")
+
+
+@pytest.fixture(scope="session")
+def sample_expense_account_id(firefly_accounts):
+    """Fixture that provides a sample expense account ID for testing."""
+    return _first_active_account_id(firefly_accounts, "expense")
+
+
+@pytest.fixture(scope="session")
 def firefly_client():
     """
     Fixture that provides a Firefly client for tests.
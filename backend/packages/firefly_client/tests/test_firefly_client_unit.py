@@ -2,17 +2,24 @@
 Unit tests for Firefly III client components that don't require external services.
 """
 
+import gzip
+import json
 from datetime import date
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
+import httpx
+import pytest
 from firefly_client import (
     Account,
     AccountAttributes,
+    AsyncFireflyClient,
     FireflyAPIError,
     FireflyClient,
+    TransactionResponse,
     TransactionSplit,
 )
+from firefly_client import _construct_transaction_response
 
 
 class TestFireflyClientUnit:
@@ -64,6 +71,65 @@ class TestFireflyClientUnit:
         assert client.host == "http://test.com"
         assert client.access_token == "test_token"
 
+    def test_convenience_function_shares_connection_pool(self):
+        """Test that create_client reuses one httpx.Client and leaves it open."""
+        from firefly_client import create_client
+
+        first = create_client(host="http://test.com", access_token="test_token")
+        second = create_client(host="http://test.com", access_token="test_token")
+
+        assert first.client is second.client
+
+        first.close()
+        assert not second.client.is_closed
+
+    def test_get_client_returns_process_wide_instance(self):
+        """Test that get_client hands out one client per host and token."""
+        from firefly_client import get_client
+
+        first = get_client(host="http://test.com", access_token="shared")
+        second = get_client(host="http://test.com", access_token="shared")
+        other = get_client(host="http://test.com", access_token="other")
+
+        assert first is second
+        assert other is not first
+
+    def test_shared_http_client_sends_per_instance_auth(self):
+        """Test that clients sharing an httpx.Client keep their own host and token."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((str(request.url), request.headers["Authorization"]))
+            return httpx.Response(204)
+
+        shared = httpx.Client(transport=httpx.MockTransport(handler))
+        first = FireflyClient(
+            host="http://one.test", access_token="token-1", httpx_client=shared
+        )
+        second = FireflyClient(
+            host="http://two.test", access_token="token-2", httpx_client=shared
+        )
+
+        first.delete_transaction(1)
+        second.delete_transaction(2)
+
+        assert seen == [
+            ("http://one.test/api/v1/transactions/1", "Bearer token-1"),
+            ("http://two.test/api/v1/transactions/2", "Bearer token-2"),
+        ]
+        assert "Authorization" not in shared.headers
+
+    @pytest.mark.parametrize("body", [b"", b"  \n"])
+    def test_empty_success_body_returns_none(self, body, mock_client):
+        """Test that empty or blank successful responses decode to None."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body)
+
+        client = mock_client(handler)
+
+        assert client._make_request("GET", "/about") is None
+
 
 class TestTransactionSplit:
     """Unit tests for TransactionSplit model."""
@@ -147,6 +213,56 @@ class TestTransactionSplit:
         assert serialized["interest_date"] == "2025-06-23"
         assert serialized["book_date"] is None
 
+    def test_extras_fields_are_nested_and_flattened(self):
+        """Test that SEPA and auxiliary fields live in extras but dump flat."""
+        split = TransactionSplit(
+            type="withdrawal",
+            date=date(2025, 6, 23),
+            amount="100.00",
+            description="Test transaction",
+            sepa_cc="DE",
+            due_date=date(2025, 7, 1),
+        )
+
+        assert split.extras.sepa_cc == "DE"
+        assert split.extras.due_date == date(2025, 7, 1)
+        assert split.model_dump(exclude_none=True) == {
+            "type": "withdrawal",
+            "date": "2025-06-23",
+            "amount": "100.00",
+            "description": "Test transaction",
+            "sepa_cc": "DE",
+            "due_date": "2025-07-01",
+        }
+
+    def test_no_extras_by_default(self):
+        """Test that splits without auxiliary fields don't allocate extras."""
+        split = TransactionSplit(
+            type="withdrawal",
+            date=date(2025, 6, 23),
+            amount="100.00",
+            description="Test transaction",
+        )
+
+        assert split.extras is None
+        assert "extras" not in split.model_dump()
+
+    def test_extras_fields_readable_on_split(self):
+        """Test that extras fields stay readable as split attributes."""
+        split = TransactionSplit(
+            type="withdrawal",
+            date=date(2025, 6, 23),
+            amount="100.00",
+            description="Test transaction",
+            interest_date=date(2025, 6, 24),
+        )
+
+        assert split.interest_date == date(2025, 6, 24)
+        assert split.sepa_cc is None
+        assert "interest_date" not in TransactionSplit.model_fields
+        with pytest.raises(AttributeError):
+            split.interest_date = date(2025, 6, 25)
+
 
 class TestAccount:
     """Unit tests for Account model."""
@@ -286,6 +402,35 @@ class TestTransactionHelpers:
         assert split.source_id == 1
         assert split.destination_id == 2
 
+    def test_split_builders_match_validated_splits(self):
+        """Test that unvalidated helper splits serialize like validated ones."""
+        split = FireflyClient._withdrawal_split(
+            12.5, "Coffee", 1, 2, date(2025, 6, 23), "Food", None, None, ["cafe"]
+        )
+        validated = TransactionSplit(
+            type="withdrawal",
+            date=date(2025, 6, 23),
+            amount=12.5,
+            description="Coffee",
+            source_id=1,
+            destination_id=2,
+            category_name="Food",
+            tags=["cafe"],
+        )
+
+        assert split.model_dump(exclude_none=True) == validated.model_dump(
+            exclude_none=True
+        )
+
+    def test_split_builders_validate_untyped_input(self):
+        """Test that date strings and extras still go through validation."""
+        split = FireflyClient._transfer_split(
+            "5", "Move", 1, 2, "2025-06-23", None, None, sepa_ct_id="ref"
+        )
+
+        assert split.date == date(2025, 6, 23)
+        assert split.extras.sepa_ct_id == "ref"
+
     def test_delete_transaction(self):
         """Test delete_transaction method."""
         mock_client = Mock(spec=FireflyClient)
@@ -311,3 +456,368 @@ class TestTransactionHelpers:
         mock_client._make_request.assert_called_once_with(
             "DELETE", "/transaction-journals/456"
         )
+
+
+class TestStoreTransaction:
+    """Unit tests for the store_transaction request body."""
+
+    def test_store_transaction_sends_serialized_body(self, store_client):
+        """Test that splits are posted as JSON without None fields."""
+        client, requests = store_client()
+
+        response = client.store_transaction(
+            [
+                TransactionSplit(
+                    type="withdrawal",
+                    date=date(2025, 6, 23),
+                    amount="12.50",
+                    description="Test",
+                )
+            ],
+            group_title="Group",
+        )
+
+        body = json.loads(requests[0].content)
+        assert response.data.id == 1
+        assert requests[0].method == "POST"
+        assert requests[0].url.path == "/api/v1/transactions"
+        assert body["group_title"] == "Group"
+        assert body["transactions"] == [
+            {
+                "type": "withdrawal",
+                "date": "2025-06-23",
+                "amount": "12.50",
+                "description": "Test",
+            }
+        ]
+
+    def test_store_transactions_bulk_posts_one_request_per_group(self, store_client):
+        """Test that splits are posted as one multi-split transaction per group."""
+        client, requests = store_client()
+
+        def split(description):
+            return TransactionSplit(
+                type="withdrawal",
+                date=date(2025, 6, 23),
+                amount="1.00",
+                description=description,
+            )
+
+        responses = client.store_transactions_bulk(
+            {"Aldi": [split("Milk"), split("Bread")], "Migros": [split("Coffee")]}
+        )
+
+        bodies = [json.loads(request.content) for request in requests]
+        assert [response.data.id for response in responses] == [1, 2]
+        assert [body["group_title"] for body in bodies] == ["Aldi", "Migros"]
+        assert [len(body["transactions"]) for body in bodies] == [2, 1]
+
+    def test_store_transaction_compresses_large_bodies(self, store_client):
+        """Test that opted-in clients gzip bodies above the size threshold."""
+        client, requests = store_client(compress_requests=True)
+        split = TransactionSplit(
+            type="withdrawal", date=date(2025, 6, 23), amount="1", description="x"
+        )
+
+        client.store_transaction([split])
+        client.store_transaction([split] * 50)
+
+        assert requests[0].headers.get("Content-Encoding") is None
+        assert requests[1].headers["Content-Encoding"] == "gzip"
+        body = json.loads(gzip.decompress(requests[1].content))
+        assert len(body["transactions"]) == 50
+
+    def test_store_transaction_fast_sends_dicts_as_is(self, store_client):
+        """Test that pre-built split dicts are posted with the default options."""
+        client, requests = store_client()
+        split = {
+            "type": "withdrawal",
+            "date": "2025-06-23",
+            "amount": "3.20",
+            "description": "Bread",
+        }
+
+        response = client.store_transaction_fast([split], group_title="Bakery")
+
+        assert response.data.id == 1
+        assert json.loads(requests[0].content) == {
+            "error_if_duplicate_hash": True,
+            "apply_rules": True,
+            "fire_webhooks": True,
+            "group_title": "Bakery",
+            "transactions": [split],
+        }
+
+
+class TestRetries:
+    """Unit tests for retrying transient error responses."""
+
+    def test_idempotent_request_retried_after_throttling(self, store_client):
+        """Test that a GET is retried on 429/503 until it succeeds."""
+        client, requests = store_client(statuses=[429, 503, 200])
+
+        assert client._make_request("GET", "/about") is not None
+        assert [request.method for request in requests] == ["GET", "GET", "GET"]
+
+    def test_retries_give_up_after_max_retries(self, store_client):
+        """Test that persistent failures surface as FireflyAPIError."""
+        client, requests = store_client(statuses=[503])
+
+        with pytest.raises(FireflyAPIError) as exc_info:
+            client._make_request("GET", "/about")
+
+        assert exc_info.value.status_code == 503
+        assert len(requests) == 4
+
+    def test_store_retried_only_when_duplicates_rejected(self, store_client):
+        """Test that POSTs are retried only with error_if_duplicate_hash."""
+        split = TransactionSplit(
+            type="withdrawal", date=date(2025, 6, 23), amount="1", description="x"
+        )
+
+        client, requests = store_client(statuses=[503, 200])
+        client.store_transaction([split])
+        assert [request.method for request in requests] == ["POST", "POST"]
+
+        client, requests = store_client(statuses=[503, 200])
+        with pytest.raises(FireflyAPIError):
+            client.store_transaction([split], error_if_duplicate_hash=False)
+        assert [request.method for request in requests] == ["POST"]
+
+
+class TestResponseParsing:
+    """Unit tests for trusted and validated response parsing."""
+
+    ACCOUNTS_PAYLOAD = {
+        "data": [
+            {
+                "id": "3",
+                "type": "accounts",
+                "attributes": {"name": "Checking", "type": "asset", "active": True},
+            }
+        ]
+    }
+
+    def _client(self, mock_client, trust_api: bool) -> FireflyClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=self.ACCOUNTS_PAYLOAD)
+
+        return mock_client(handler, trust_api=trust_api)
+
+    @pytest.mark.parametrize("trust_api", [True, False])
+    def test_get_accounts_parses_string_ids(self, trust_api, mock_client):
+        """Test that both parsing modes produce the same account models."""
+        accounts = self._client(mock_client, trust_api).get_accounts()
+
+        account = accounts.data[0]
+        assert isinstance(account, Account)
+        assert account.id == 3
+        assert account.attributes.name == "Checking"
+        assert account.attributes.type == "asset"
+        assert account.attributes.active is True
+
+    def test_get_accounts_revalidates_with_etag(self, mock_client):
+        """Test that a repeated query sends If-None-Match and reuses a 304."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200, json=self.ACCOUNTS_PAYLOAD, headers={"ETag": '"v1"'}
+            )
+
+        client = mock_client(handler)
+
+        first = client.get_accounts(type_filter="asset")
+        second = client.get_accounts(type_filter="asset")
+        other = client.get_accounts(type_filter="expense")
+
+        assert seen == [None, '"v1"', None]
+        assert second is first
+        assert other is not first
+        assert first.data[0].attributes.name == "Checking"
+
+    @pytest.mark.parametrize("trust_api", [True, False])
+    def test_store_transaction_parses_response(self, trust_api, mock_client):
+        """Test that both parsing modes coerce the transaction response."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": "7",
+                        "attributes": {
+                            "transactions": [
+                                {
+                                    "type": "withdrawal",
+                                    "date": "2025-06-23",
+                                    "amount": "12.50",
+                                    "description": "Test",
+                                }
+                            ]
+                        },
+                    }
+                },
+            )
+
+        client = mock_client(handler, trust_api=trust_api)
+        split = TransactionSplit(
+            type="withdrawal", date=date(2025, 6, 23), amount="12.50", description="x"
+        )
+
+        response = client.store_transaction([split])
+
+        assert isinstance(response, TransactionResponse)
+        assert response.data.id == 7
+        assert response.data.attributes.transactions[0].amount == Decimal("12.50")
+
+    def test_iter_accounts_streams_accounts(self, mock_client):
+        """Test that iter_accounts yields the same accounts as get_accounts."""
+        client = self._client(mock_client, trust_api=True)
+
+        accounts = list(client.iter_accounts())
+
+        assert [account.id for account in accounts] == [3]
+        assert accounts[0].attributes.name == "Checking"
+
+    def test_iter_accounts_raises_api_errors(self, mock_client):
+        """Test that iter_accounts surfaces error responses as FireflyAPIError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401, json={"message": "Unauthenticated."})
+
+        client = mock_client(handler)
+
+        with pytest.raises(FireflyAPIError, match="Unauthenticated."):
+            list(client.iter_accounts())
+
+    def test_trusted_transaction_response_validates_splits(self):
+        """Test that trusted parsing still coerces split amounts and dates."""
+        response = _construct_transaction_response(
+            {
+                "data": {
+                    "id": "7",
+                    "attributes": {
+                        "transactions": [
+                            {
+                                "type": "withdrawal",
+                                "date": "2025-06-23",
+                                "amount": "12.50",
+                                "description": "Test",
+                                "source_id": "1",
+                            }
+                        ]
+                    },
+                }
+            }
+        )
+
+        split = response.data.attributes.transactions[0]
+        assert response.data.id == 7
+        assert split.amount == Decimal("12.50")
+        assert split.date == date(2025, 6, 23)
+        assert split.source_id == 1
+
+
+class TestAsyncFireflyClient:
+    """Unit tests for AsyncFireflyClient that don't require external connections."""
+
+    def test_initialization(self):
+        """Test async client initialization and default headers."""
+        client = AsyncFireflyClient(host="http://test.com/", access_token="token")
+
+        assert client.host == "http://test.com"
+        assert isinstance(client.client, httpx.AsyncClient)
+        assert client.client.headers["Authorization"] == "Bearer token"
+
+    def test_missing_host(self):
+        """Test that the async client validates the host like the sync client."""
+        with pytest.raises(ValueError, match="Firefly III host must be provided"):
+            AsyncFireflyClient(host="", access_token="token")
+
+    @pytest.mark.asyncio
+    async def test_convenience_function_shares_connection_pool(self):
+        """Test that create_async_client reuses one pool per event loop."""
+        from firefly_client import create_async_client
+
+        first = create_async_client(host="http://test.com", access_token="a")
+        second = create_async_client(host="http://test.com", access_token="b")
+
+        assert isinstance(first, AsyncFireflyClient)
+        assert first.client is second.client
+
+        await first.aclose()
+        assert not second.client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_aclose_async_clients_closes_shared_pool(self):
+        """Test that the shared pool is closed and replaced after aclose."""
+        from firefly_client import aclose_async_clients, create_async_client
+
+        client = create_async_client(host="http://test.com", access_token="a")
+        await aclose_async_clients()
+
+        assert client.client.is_closed
+        fresh = create_async_client(host="http://test.com", access_token="a")
+        assert fresh.client is not client.client
+        await aclose_async_clients()
+
+    @pytest.mark.asyncio
+    async def test_get_accounts(self, mock_async_client):
+        """Test that accounts are fetched and parsed asynchronously."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/v1/accounts"
+            assert request.url.params["type"] == "asset"
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {"id": 1, "attributes": {"name": "Checking", "type": "asset"}}
+                    ]
+                },
+            )
+
+        async with mock_async_client(handler) as client:
+            accounts = await client.get_accounts(type_filter="asset")
+
+        assert len(accounts.data) == 1
+        assert accounts.data[0].attributes.name == "Checking"
+
+    @pytest.mark.asyncio
+    async def test_get_accounts_by_ids(self, mock_async_client):
+        """Test that several accounts are fetched in the order requested."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            account_id = request.url.path.rsplit("/", 1)[1]
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": account_id,
+                        "attributes": {"name": f"Account {account_id}"},
+                    }
+                },
+            )
+
+        async with mock_async_client(handler) as client:
+            accounts = await client.get_accounts_by_ids([3, 1, 2])
+
+        assert [account.id for account in accounts] == [3, 1, 2]
+        assert accounts[0].attributes.name == "Account 3"
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self, mock_async_client):
+        """Test that API errors are raised as FireflyAPIError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"message": "Not found"})
+
+        async with mock_async_client(handler) as client:
+            with pytest.raises(FireflyAPIError, match="Not found") as exc_info:
+                await client.get_account(99)
+
+        assert exc_info.value.status_code == 404
@@ -1,30 +1,109 @@
 import asyncio
-import base64
-import json
+import hashlib
 import logging
+import mimetypes
+import mmap
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Optional, TypedDict
 
 import mcp.types as types
+import orjson
+import pybase64
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.session import RequestResponder
-from openai import OpenAI
-from papermes_shared.shared import http_client
+from openai import AsyncOpenAI
+from papermes_shared.shared import create_async_http_client
+from pydantic import ConfigDict, TypeAdapter
 
 # Import dependencies - these will be handled by the package system
-from .config import config
+from .config import get_config
 
-client = OpenAI(api_key=config.openai.api_key, http_client=http_client)
+config = get_config()
 
 # Use pricing from config
 gpt_prompt_pricing = config.openai.prompt_token_cost
 gpt_completion_pricing = config.openai.completion_token_cost
 
+# Receipts analyzed at once, bounded to the shared HTTP connection pool
+RECEIPT_CONCURRENCY = 20
+
+# Merged into every transaction the LLM extracts from a receipt
+_WITHDRAWAL = {"type": "withdrawal"}
+
+# Parses the firefly://accounts resource in a single pass
+_ACCOUNTS_ADAPTER = TypeAdapter(list[dict])
+
+
+class _ToolCallArgs(TypedDict, total=False):
+    """Arguments of an LLM function call; unknown keys are passed through."""
+
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    transactions: list[dict]
+
+
+# Decodes and validates tool call arguments in a single jiter pass
+_TOOL_CALL_ARGS_ADAPTER = TypeAdapter(_ToolCallArgs)
+
 
 def encode_image_to_base64(image_path: Path) -> str:
     """Encode an image file to base64 string."""
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return ""  # an empty file cannot be mapped
+        # Encode straight from the page cache instead of copying the file into
+        # a bytes object first; pybase64 uses SIMD encoders where available
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            return pybase64.b64encode(image).decode("ascii")
+
+
+# OpenAI file IDs of uploaded images, keyed by the SHA-256 of their content
+_uploaded_files: dict[str, str] = {}
+
+
+def _read_and_hash(image_path: Path) -> tuple[bytes, str]:
+    image_bytes = image_path.read_bytes()
+    return image_bytes, hashlib.sha256(image_bytes).hexdigest()
+
+
+async def upload_receipt_image(image_path: Path, openai_client: AsyncOpenAI) -> str:
+    """
+    Upload an image file to OpenAI and return its file ID.
+
+    Images already uploaded by this process, by content, reuse their file ID.
+    """
+    # Read on a worker thread so concurrent receipts don't block the event loop
+    image_bytes, digest = await asyncio.to_thread(_read_and_hash, image_path)
+    file_id = _uploaded_files.get(digest)
+    if file_id is None:
+        uploaded = await openai_client.files.create(
+            file=(image_path.name, image_bytes), purpose="vision"
+        )
+        file_id = _uploaded_files[digest] = uploaded.id
+    return file_id
+
+
+async def receipt_image_input(image_path: Path, openai_client: AsyncOpenAI) -> dict:
+    """
+    Build the input_image item for a receipt.
+
+    The image is uploaded and referenced by file ID, or sent inline as a
+    base64 data URI when image uploads are disabled in the config.
+    """
+    if config.openai.upload_images:
+        file_id = await upload_receipt_image(image_path, openai_client)
+        return {"type": "input_image", "file_id": file_id}
+    mime_type = mimetypes.guess_type(image_path.name)[0] or "image/jpeg"
+    # Encode on a worker thread so concurrent receipts don't block the event loop
+    image_base64 = await asyncio.to_thread(encode_image_to_base64, image_path)
+    return {
+        "type": "input_image",
+        "image_url": f"data:{mime_type};base64,{image_base64}",
+    }
 
 
 # Configure logging using config
@@ -48,6 +127,88 @@ class LoggingCollector:
 logging_collector = LoggingCollector()
 
 
+@dataclass
+class MCPSessionCache:
+    """Tools, prompts and resources of an MCP session, fetched once per connection."""
+
+    tools: types.ListToolsResult
+    prompts: types.ListPromptsResult
+    resources: Optional[types.ListResourcesResult]
+    functions: list[dict]
+    prompt_results: dict[tuple[str, bytes], types.GetPromptResult] = field(
+        default_factory=dict
+    )
+    accounts: Optional[list[dict]] = None
+
+    @classmethod
+    async def load(
+        cls, session: ClientSession, list_resources: bool = False
+    ) -> "MCPSessionCache":
+        """
+        List the session's tools and prompts and read the accounts resource.
+
+        The requests are independent and sent concurrently. Resources are only
+        listed on request, since nothing but debug output uses them.
+        """
+        requests = [
+            session.list_tools(),
+            session.list_prompts(),
+            session.read_resource("firefly://accounts"),
+        ]
+        if list_resources:
+            requests.append(session.list_resources())
+        tools, prompts, account_resource, *resources = await asyncio.gather(*requests)
+        return cls(
+            tools=tools,
+            prompts=prompts,
+            resources=resources[0] if resources else None,
+            functions=[convert_to_llm_tool(tool) for tool in tools.tools],
+            accounts=_parse_accounts(account_resource),
+        )
+
+    async def get_prompt(
+        self,
+        session: ClientSession,
+        name: str,
+        arguments: Optional[dict[str, Any]] = None,
+    ) -> types.GetPromptResult:
+        """
+        Get a rendered prompt, reusing earlier results for the same arguments.
+
+        MCP prompt arguments are strings; other values are sent JSON-encoded
+        and decoded by the server into the prompt's parameter types.
+        """
+        if arguments:
+            arguments = {
+                arg: value if isinstance(value, str) else orjson.dumps(value).decode()
+                for arg, value in arguments.items()
+            }
+        key = (name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+        if key not in self.prompt_results:
+            self.prompt_results[key] = await session.get_prompt(
+                name, arguments=arguments
+            )
+        return self.prompt_results[key]
+
+    async def get_accounts(self, session: ClientSession) -> list[dict]:
+        """Read the firefly://accounts resource once per session."""
+        if self.accounts is None:
+            account_resource = await session.read_resource("firefly://accounts")
+            self.accounts = _parse_accounts(account_resource)
+        return self.accounts
+
+
+def _parse_accounts(account_resource: types.ReadResourceResult) -> list[dict]:
+    """Decode the accounts list from a firefly://accounts resource."""
+    accounts = []
+    for account in account_resource.contents:
+        if account.mimeType != "application/json":
+            logger.error("Unexpected MIME type: %s", account.mimeType)
+            continue
+        accounts = _ACCOUNTS_ADAPTER.validate_json(account.text)
+    return accounts
+
+
 async def message_handler(
     message: RequestResponder[types.ServerRequest, types.ClientResult]
     | types.ServerNotification
@@ -66,27 +227,29 @@ async def message_handler(
 
 
 async def analyze_receipt(
-    base64_image: str, accounts: list[dict], tools, session: ClientSession
+    image_input: dict,
+    accounts: list[dict],
+    session: ClientSession,
+    cache: MCPSessionCache,
+    openai_client: AsyncOpenAI,
 ):
-    """Analyze receipt using MCP prompts"""
+    """Analyze receipt using MCP prompts and the session's tools"""
 
     # Use model from config
-    model_name = config.services.openai.model
-
-    functions = [convert_to_llm_tool(tool) for tool in tools]
+    model_name = config.openai.model
 
     # Get developer context prompt
-    developer_prompt_result = await session.get_prompt(
-        "developer_bookkeeping_context", arguments={"accounts": accounts}
+    developer_prompt_result = await cache.get_prompt(
+        session, "developer_bookkeeping_context", arguments={"accounts": accounts}
     )
     developer_content = developer_prompt_result.messages[0].content
 
     # Get user analysis prompt
-    user_prompt_result = await session.get_prompt("user_analyze_receipt")
+    user_prompt_result = await cache.get_prompt(session, "user_analyze_receipt")
     user_text = user_prompt_result.messages[0].content
 
-    print("CALLING LLM")
-    response = client.responses.create(
+    logger.debug("Calling LLM")
+    response = await openai_client.responses.create(
         model=model_name,
         instructions="",
         input=[
@@ -98,123 +261,207 @@ async def analyze_receipt(
                 "role": "user",
                 "content": [
                     {"type": "input_text", "text": user_text},
-                    {
-                        "type": "input_image",
-                        "image_url": f"data:image/jpeg;base64,{base64_image}",
-                    },
+                    image_input,
                 ],
             },
         ],
-        tools=functions,
+        tools=cache.functions,
     )
     usage = (
         response.usage.output_tokens * gpt_completion_pricing
         + response.usage.input_tokens * gpt_prompt_pricing
     )
 
-    print(f"Total USD burned: ${usage}")
+    logger.info("Total USD burned: $%s", usage)
 
-    functions_to_call = []
+    function_calls = [
+        output for output in response.output if output.type == "function_call"
+    ]
+    return _collect_function_calls(function_calls)
 
-    for tool_call in response.output:
-        if tool_call.type != "function_call":
-            continue
 
-        name = tool_call.name
-        args = json.loads(tool_call.arguments)
+def _collect_function_calls(function_calls: list) -> list[dict]:
+    """Decode the model's function calls into MCP tool calls.
 
-        if args["transactions"]:
-            # append type to all transactions:
-            for transaction in args["transactions"]:
-                transaction["type"] = "withdrawal"
+    create_transactions calls that share a group title are merged, so each
+    group is stored with a single request. Untitled calls are independent
+    transactions and are passed through unchanged.
+    """
+    functions_to_call = []
+    transaction_calls: dict[str, dict] = {}
+
+    for tool_call in function_calls:
+        args = _TOOL_CALL_ARGS_ADAPTER.validate_json(tool_call.arguments)
+
+        # Receipts are always expenses
+        for transaction in args.get("transactions") or ():
+            transaction |= _WITHDRAWAL
+
+        group_title = args.get("group_title")
+        if tool_call.name == "create_transactions" and group_title is not None:
+            transactions = args.get("transactions") or []
+            merged = transaction_calls.get(group_title)
+            if merged is not None:
+                merged["args"]["transactions"].extend(transactions)
+                continue
+            args["transactions"] = list(transactions)
+            transaction_calls[group_title] = {"name": tool_call.name, "args": args}
+            functions_to_call.append(transaction_calls[group_title])
+            continue
 
-        functions_to_call.append({"name": name, "args": args})
+        functions_to_call.append({"name": tool_call.name, "args": args})
 
     return functions_to_call
 
 
-def convert_to_llm_tool(tool: types.Tool):
-    tool_schema = {
+def convert_to_llm_tool(tool: types.Tool) -> dict:
+    """Describe an MCP tool as an OpenAI function tool.
+
+    The properties schema is shared with the tool, not copied; callers must
+    treat the result as read-only.
+    """
+    return {
         "name": tool.name,
         "description": tool.description,
         "type": "function",
         "parameters": {"type": "object", "properties": tool.inputSchema["properties"]},
     }
 
-    return tool_schema
 
+# Shared MCP connection, opened on first use and reused by later main() calls
+_MCP_URL = f"http://{config.mcp_server.host}:{config.mcp_server.port}/mcp"
+_session: Optional[ClientSession] = None
+_session_stack: Optional[AsyncExitStack] = None
+_session_lock = asyncio.Lock()
 
-async def main():
-    logger.info("Starting client...")
-    async with streamablehttp_client(
-        f"http://{config.mcp_server.host}:{config.mcp_server.port}/mcp"
-    ) as (
-        read_stream,
-        write_stream,
-        session_callback,
-    ):
-        async with ClientSession(
-            read_stream,
-            write_stream,
-            logging_callback=logging_collector,
-            message_handler=message_handler,
-        ) as session:
+
+@asynccontextmanager
+async def _get_session():
+    """Yield the shared, initialized MCP session, connecting on first use."""
+    global _session, _session_stack
+    async with _session_lock:
+        if _session is None:
+            stack = AsyncExitStack()
+            read_stream, write_stream, _ = await stack.enter_async_context(
+                streamablehttp_client(_MCP_URL)
+            )
+            session = await stack.enter_async_context(
+                ClientSession(
+                    read_stream,
+                    write_stream,
+                    logging_callback=logging_collector,
+                    message_handler=message_handler,
+                )
+            )
             # Initialize the connection
             await session.initialize()
-
-            # List available resources
-            resources = await session.list_resources()
-            print("LISTING RESOURCES")
-            for resource in resources:
-                print("Resource: ", resource)  # List available tools
-            tools = await session.list_tools()
-            print("LISTING TOOLS")
-
-            for tool in tools.tools:
-                print("Tool: ", tool.name)
-                print("Tool", tool.inputSchema["properties"])
-
-            # List available prompts
-            prompts = await session.list_prompts()
-            print("LISTING PROMPTS")
-            for prompt in prompts.prompts:
-                print("Prompt: ", prompt.name)
-
-            # Get accounts from Firefly III
-            account_resource = await session.read_resource("firefly://accounts")
-            accounts = []
-            print("ACCOUNTS:")
-            for account in account_resource.contents:
-                if account.mimeType != "application/json":
-                    logger.error(f"Unexpected MIME type: {account.mimeType}")
-                    continue
-                accounts = json.loads(account.text)
-            # Analyze a receipt image
-            # Find the testdata directory relative to this script
-            script_dir = Path(__file__).parent
-            testdata_dir = script_dir.parent.parent.parent / "testdata"
-
-            image_path = testdata_dir / "photos" / "receipts" / "Shopping Aldi.jpg"
-            if not image_path.exists():
-                logger.error(f"Image file not found at {image_path}")
-                return
-            # Encode image to base64
-            base64_image = encode_image_to_base64(image_path)
-            logger.info(f"Analyzing image: {image_path.name}")
-
-            # Use the new prompt-based analysis
-            functions_to_call = await analyze_receipt(
-                base64_image, accounts, tools.tools, session
+            _session, _session_stack = session, stack
+    yield _session
+
+
+async def close_session():
+    """Close the shared MCP session and its transport."""
+    global _session, _session_stack
+    async with _session_lock:
+        if _session_stack is not None:
+            await _session_stack.aclose()
+        _session, _session_stack = None, None
+
+
+async def process_receipt(
+    image_path: Path,
+    accounts: list[dict],
+    session: ClientSession,
+    cache: MCPSessionCache,
+    semaphore: asyncio.Semaphore,
+    openai_client: AsyncOpenAI,
+):
+    """Analyze one receipt image and call the tools the LLM asked for."""
+    async with semaphore:
+        image_input = await receipt_image_input(image_path, openai_client)
+        logger.info("Analyzing image: %s", image_path.name)
+
+        # Use the new prompt-based analysis
+        functions_to_call = await analyze_receipt(
+            image_input, accounts, session, cache, openai_client
+        )
+
+        # The tool calls are independent; run them concurrently
+        results = await asyncio.gather(
+            *(
+                session.call_tool(function["name"], arguments=function["args"])
+                for function in functions_to_call
             )
+        )
+        for result in results:
+            logger.info("Tool result: %s", result.content)
+
 
-            for function in functions_to_call:
-                result = await session.call_tool(
-                    function["name"], arguments=function["args"]
+async def main():
+    logger.info("Starting client...")
+    # The OpenAI client and its HTTP pool are bound to this event loop, so
+    # they are created here and closed (pool included) when main() returns
+    async with (
+        AsyncOpenAI(
+            api_key=config.openai.api_key_value,
+            http_client=create_async_http_client(),
+        ) as openai_client,
+        _get_session() as session,
+    ):
+        # List available tools and prompts and fetch the accounts once per
+        # session; resources are only listed for debug output
+        debug = logger.isEnabledFor(logging.DEBUG)
+        cache = await MCPSessionCache.load(session, list_resources=debug)
+        if debug:
+            for resource in cache.resources.resources:
+                logger.debug("Resource: %s", resource)
+            for tool in cache.tools.tools:
+                logger.debug("Tool: %s %s", tool.name, tool.inputSchema["properties"])
+            for prompt in cache.prompts.prompts:
+                logger.debug("Prompt: %s", prompt.name)
+
+        # Get accounts from Firefly III
+        accounts = await cache.get_accounts(session)
+        # Prefetch the prompts so concurrent receipts share one fetch
+        await asyncio.gather(
+            cache.get_prompt(
+                session,
+                "developer_bookkeeping_context",
+                arguments={"accounts": accounts},
+            ),
+            cache.get_prompt(session, "user_analyze_receipt"),
+        )
+
+        # Analyze all receipt images concurrently
+        receipts_dir = config.testdata_dir_path / "photos" / "receipts"
+        image_paths = sorted(receipts_dir.glob("*.jpg"))
+        if not image_paths:
+            logger.error("No receipt images found in %s", receipts_dir)
+            return
+
+        semaphore = asyncio.Semaphore(RECEIPT_CONCURRENCY)
+        results = await asyncio.gather(
+            *(
+                process_receipt(
+                    image_path, accounts, session, cache, semaphore, openai_client
                 )
-                print("TOOLS result: ", result.content)
+                for image_path in image_paths
+            ),
+            return_exceptions=True,
+        )
+        for image_path, result in zip(image_paths, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to process %s: %s", image_path.name, result)
 
 
 if __name__ == "__main__":
     # MCP client mode
     logger.info("Running MCP client...")
-    asyncio.run(main())
+
+    async def run():
+        try:
+            await main()
+        finally:
+            await close_session()
+
+    asyncio.run(run())
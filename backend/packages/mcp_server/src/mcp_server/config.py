@@ -1,6 +1,12 @@
+from functools import cached_property, lru_cache
+from pathlib import Path
+
 from papermes_shared.config import BaseConfig
 from pydantic import BaseModel
 
+# Root of the mcp_server package (the directory containing prompts/)
+PACKAGE_DIR = Path(__file__).parent.parent.parent
+
 
 class TemplatesConfig(BaseModel):
     """Templates configuration"""
@@ -9,6 +15,7 @@ class TemplatesConfig(BaseModel):
     trim_blocks: bool = True
     lstrip_blocks: bool = True
     prompts_dir: str = "prompts"
+    bytecode_cache_dir: str = ".jinja_cache"
 
 
 class MCPServerConfig(BaseModel):
@@ -24,5 +31,23 @@ class MCPConfig(BaseConfig):
     mcp_server: MCPServerConfig = MCPServerConfig()
     templates: TemplatesConfig = TemplatesConfig()
 
+    @cached_property
+    def prompts_dir_path(self) -> Path:
+        """Absolute path of the prompt templates directory"""
+        return PACKAGE_DIR / self.templates.prompts_dir
+
+    @cached_property
+    def bytecode_cache_path(self) -> Path:
+        """Absolute path of the compiled template cache directory"""
+        return PACKAGE_DIR / self.templates.bytecode_cache_dir
+
+    @cached_property
+    def testdata_dir_path(self) -> Path:
+        """Absolute path of the repository testdata directory"""
+        return PACKAGE_DIR.parents[2] / "testdata"
+
 
-config = MCPConfig()
+@lru_cache(maxsize=1)
+def get_config() -> MCPConfig:
+    """Get the MCP configuration instance, loading it on first use"""
+    return MCPConfig()
@@ -1,16 +1,21 @@
 import logging
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 from datetime import datetime
 from decimal import Decimal
-from pathlib import Path
-from typing import List, Optional, Union
+from typing import AsyncIterator, List, Optional, Union
 
 import jinja2
-from fastmcp import FastMCP
-from firefly_client import FireflyAPIError, FireflyClient
-from pydantic import BaseModel
+from fastmcp import Context, FastMCP
+from firefly_client import (
+    AsyncFireflyClient,
+    FireflyAPIError,
+    TransactionSplit,
+)
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from .config import get_config
 
-from .config import config
+config = get_config()
 
 # Set up logging using config
 logging.basicConfig(
@@ -20,17 +25,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Split fields that receive (source_account, destination_account) per type:
+# withdrawals spend from an asset account into an expense account name,
+# deposits come from a revenue account name into an account ID, and
+# transfers move between two account IDs.
+_TRANSACTION_ROUTES = {
+    "withdrawal": ("source_name", "destination_name"),
+    "deposit": ("source_name", "destination_id"),
+    "transfer": ("source_id", "destination_id"),
+}
+
+
+@asynccontextmanager
+async def firefly_lifespan(server: FastMCP) -> AsyncIterator[dict]:
+    """
+    Hold an MCP session's AsyncFireflyClient and close it when the session ends.
+
+    The lifespan runs once per session, on the event loop that serves it, so
+    the client's connection pool is reused by every call in the session. The
+    client is opened on first use by get_async_firefly_client(), so sessions
+    that never reach Firefly III (or run without its configuration) still start.
+    """
+    state: dict[str, AsyncFireflyClient] = {}
+    try:
+        yield state
+    finally:
+        client = state.pop("firefly", None)
+        if client is not None:
+            await client.aclose()
+
+
 # Initialize FastMCP server using config
-mcp = FastMCP(config.mcp_server.name)
+mcp = FastMCP(config.mcp_server.name, lifespan=firefly_lifespan)
+
+
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    """Persist compiled templates across restarts, if the cache dir is writable"""
+    try:
+        config.bytecode_cache_path.mkdir(exist_ok=True)
+    except OSError as e:
+        logger.warning("Template bytecode cache disabled: %s", e)
+        return None
+    return jinja2.FileSystemBytecodeCache(str(config.bytecode_cache_path))
+
 
 # Initialize Jinja2 environment for prompt templates using config
 jinja_env = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(Path(__file__).parent.parent.parent / "prompts"),
+    loader=jinja2.FileSystemLoader(config.prompts_dir_path),
     autoescape=config.templates.autoescape,
     trim_blocks=config.templates.trim_blocks,
     lstrip_blocks=config.templates.lstrip_blocks,
+    # Templates ship with the package; skip the per-render mtime check
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=_bytecode_cache(),
 )
 
+# Parse every prompt template once at import
+_PROMPTS = {
+    name.removesuffix(".jinja2"): jinja_env.get_template(name)
+    for name in jinja_env.list_templates(extensions=["jinja2"])
+}
+
 
 def render_prompt_template(template_name: str, **kwargs) -> str:
     """
@@ -44,35 +100,47 @@ def render_prompt_template(template_name: str, **kwargs) -> str:
         str: Rendered template string
     """
     try:
-        template = jinja_env.get_template(f"{template_name}.jinja2")
+        template = _PROMPTS.get(template_name) or jinja_env.get_template(
+            f"{template_name}.jinja2"
+        )
         return template.render(**kwargs)
     except jinja2.TemplateNotFound:
-        logger.error(f"Template not found: {template_name}")
+        logger.error("Template not found: %s", template_name)
         raise
     except jinja2.TemplateError as e:
-        logger.error(f"Template rendering error: {e}")
+        logger.error("Template rendering error: %s", e)
         raise
 
 
-@contextmanager
-def get_firefly_client():
+def get_async_firefly_client(ctx: Context) -> AsyncFireflyClient:
     """
-    Context manager to get a configured FireflyClient instance.
+    Get the AsyncFireflyClient of this MCP session, opening it on first use.
+
+    The MCP handlers run on the server's event loop, so they use the async
+    client to keep Firefly III requests from blocking other tool calls.
 
-    Yields:
-        FireflyClient: Configured client instance
+    Args:
+        ctx: Context of the current MCP request
+
+    Returns:
+        AsyncFireflyClient: Client closed by firefly_lifespan
     """
-    with FireflyClient(
-        host=config.firefly.host,
-        access_token=config.firefly.access_token.get_secret_value(),
-        timeout=config.firefly.timeout,
-    ) as client:
-        yield client
+    state = ctx.request_context.lifespan_context
+    client = state.get("firefly")
+    if client is None:
+        client = state["firefly"] = AsyncFireflyClient(
+            host=config.firefly.host,
+            access_token=config.firefly.access_token_value,
+            timeout=config.firefly.timeout,
+        )
+    return client
 
 
 class Account(BaseModel):
     """Account model"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     type: str
@@ -83,6 +151,8 @@ class Account(BaseModel):
 class TransactionRequest(BaseModel):
     """Transaction request model for MCP tool"""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str  # withdrawal, deposit, transfer
     source_account: Optional[str] = None  # account ID or name
     destination_account: Optional[str] = None  # account ID or name
@@ -96,52 +166,63 @@ class TransactionRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
+# Serializes the whole accounts list in one pydantic-core pass
+_ACCOUNTS_ADAPTER = TypeAdapter(List[Account])
+# Validates a whole batch of requested splits in one pydantic-core call
+_SPLITS_ADAPTER = TypeAdapter(List[TransactionSplit])
+
+
 @mcp.resource("firefly://accounts", mime_type="application/json")
-async def get_accounts() -> List[Account]:
+async def get_accounts(ctx: Context) -> str:
     """
     Get accounts from Firefly III.
 
+    Args:
+        ctx: Context of the current MCP request
+
     Returns:
-        List[Account]: List of account objects with mapped fields
+        str: JSON list of account objects with mapped fields
     """
     try:
-        # Create Firefly client with config values
-        with get_firefly_client() as client:
-            # Fetch accounts from Firefly III
-            firefly_accounts = client.get_accounts()
-            # Map Firefly account data to MCP Account model
-            accounts = []
-            for firefly_account in firefly_accounts.data:
-                account = Account(
-                    id=firefly_account.id,
-                    name=firefly_account.attributes.name,
-                    type=firefly_account.attributes.type,
-                    notes=firefly_account.attributes.notes or "",
-                    currency_code=firefly_account.attributes.currency_code
-                    or config.app.default_currency,
-                )
-                accounts.append(account)
-
-            return accounts
+        # Get this session's Firefly client, opened from config values
+        client = get_async_firefly_client(ctx)
+        # Fetch accounts from Firefly III
+        firefly_accounts = await client.get_accounts()
+        # Map Firefly account data to MCP Account model; the data was
+        # already typed by the Firefly client, so skip re-validation
+        default_currency = config.app.default_currency
+        accounts = [
+            Account.model_construct(
+                id=firefly_account.id,
+                name=firefly_account.attributes.name,
+                type=firefly_account.attributes.type,
+                notes=firefly_account.attributes.notes or "",
+                currency_code=firefly_account.attributes.currency_code
+                or default_currency,
+            )
+            for firefly_account in firefly_accounts.data
+        ]
+
+        return _ACCOUNTS_ADAPTER.dump_json(accounts).decode()
 
     except FireflyAPIError as e:
         # Handle Firefly API errors gracefully
-        print(f"Firefly API Error: {e}")
-        if e.status_code:
-            print(f"Status Code: {e.status_code}")
+        logger.exception("Firefly API Error (status code %s)", e.status_code)
         # Return empty list on error
-        return []
+        return "[]"
 
-    except Exception as e:
+    except Exception:
         # Handle other errors (missing environment variables, etc.)
-        print(f"Error connecting to Firefly III: {e}")
+        logger.exception("Error connecting to Firefly III")
         # Return empty list on error
-        return []
+        return "[]"
 
 
 @mcp.tool()
 async def create_transactions(
-    transactions: List[TransactionRequest], group_title: Optional[str] = None
+    transactions: List[TransactionRequest],
+    ctx: Context,
+    group_title: Optional[str] = None,
 ) -> dict:
     """
     Create a transaction in Firefly III.
@@ -149,82 +230,73 @@ async def create_transactions(
     Args:
         transactions: List of transaction splits to create
         group_title: Optional title for the transaction group
+        ctx: Context of the current MCP request
 
     Returns:
         dict: Success status and transaction details or error message
     """
-    for tx_request in transactions:
-        logger.info(f"Processing transaction request: {tx_request.model_dump()}")
+    if logger.isEnabledFor(logging.INFO):
+        for tx_request in transactions:
+            logger.info("Processing transaction request: %s", tx_request.model_dump())
     # return {
     #    "success": False,
     #    "error": "This tool is not implemented yet. Please implement the create_transaction function."
     # }
+
+    # Reject invalid types before connecting to Firefly III
+    invalid_type = next(
+        (tx.type for tx in transactions if tx.type not in _TRANSACTION_ROUTES), None
+    )
+    if invalid_type is not None:
+        return {
+            "success": False,
+            "error": f"Invalid transaction type: {invalid_type}. Must be 'withdrawal', 'deposit', or 'transfer'",
+        }
+
     try:
-        # Create Firefly client with config values
-        with get_firefly_client() as client:
-            # Convert TransactionRequest objects to TransactionSplit objects
-            transaction_splits = []
-
-            for tx_request in transactions:
-                # Determine source and destination based on transaction type
-                source_id = None
-                source_name = None
-                destination_id = None
-                destination_name = None
-
-                if tx_request.type == "withdrawal":
-                    # For withdrawals: source should be an account ID, destination should be an expense account name
-                    source_name = tx_request.source_account
-                    destination_name = tx_request.destination_account
-                elif tx_request.type == "deposit":
-                    # For deposits: source should be a revenue account name, destination should be an account ID
-                    source_name = tx_request.source_account
-                    destination_id = tx_request.destination_account
-                elif tx_request.type == "transfer":
-                    # For transfers: both should be account IDs
-                    source_id = tx_request.source_account
-                    destination_id = tx_request.destination_account
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Invalid transaction type: {tx_request.type}. Must be 'withdrawal', 'deposit', or 'transfer'",
-                    }  # Create transaction split using the firefly_client's TransactionSplit model
-                from firefly_client import TransactionSplit
-
-                split = TransactionSplit(
-                    type=tx_request.type,
-                    date=tx_request.date
-                    or datetime.now()
-                    .date()
-                    .isoformat(),  # Will default to today in Firefly
-                    amount=tx_request.amount,
-                    description=tx_request.description,
-                    source_id=source_id,
-                    source_name=source_name,
-                    destination_id=destination_id,
-                    destination_name=destination_name,
-                    currency_code=tx_request.currency_code
-                    or config.app.default_currency,
-                    category_name=tx_request.category_name,
-                    budget_name=tx_request.budget_name,
-                    notes=tx_request.notes,
-                    tags=tx_request.tags,
-                )
-                transaction_splits.append(split)
-
-            # Create the transaction
-            response = client.store_transaction(
-                transactions=transaction_splits, group_title=group_title
+        # Get this session's Firefly client, opened from config values
+        client = get_async_firefly_client(ctx)
+        # Requests without a date default to today
+        today = datetime.now().date().isoformat()
+        default_currency = config.app.default_currency
+
+        # Build plain split dicts; the account fields are routed by type
+        split_data = []
+        for tx_request in transactions:
+            source_field, destination_field = _TRANSACTION_ROUTES[tx_request.type]
+            split_data.append(
+                {
+                    "type": tx_request.type,
+                    "date": tx_request.date or today,
+                    "amount": tx_request.amount,
+                    "description": tx_request.description,
+                    source_field: tx_request.source_account,
+                    destination_field: tx_request.destination_account,
+                    "currency_code": tx_request.currency_code or default_currency,
+                    "category_name": tx_request.category_name,
+                    "budget_name": tx_request.budget_name,
+                    "notes": tx_request.notes,
+                    "tags": tx_request.tags,
+                }
             )
 
-            return {
-                "success": True,
-                "transaction_id": response.data.id,
-                "message": f"Transaction created successfully with {len(transaction_splits)} split(s)",
-                "group_title": group_title,
-            }
+        # Validate all splits into TransactionSplit models in one pass
+        transaction_splits = _SPLITS_ADAPTER.validate_python(split_data)
+
+        # Create the transaction
+        response = await client.store_transaction(
+            transactions=transaction_splits, group_title=group_title
+        )
+
+        return {
+            "success": True,
+            "transaction_id": response.data.id,
+            "message": f"Transaction created successfully with {len(transaction_splits)} split(s)",
+            "group_title": group_title,
+        }
 
     except FireflyAPIError as e:
+        logger.exception("Firefly API Error (status code %s)", e.status_code)
         return {
             "success": False,
             "error": f"Firefly API Error: {e}",
@@ -232,6 +304,7 @@ async def create_transactions(
         }
 
     except Exception as e:
+        logger.exception("Error creating transaction")
         return {"success": False, "error": f"Error creating transaction: {e}"}
 
 
@@ -271,5 +344,5 @@ def run_server():
             port=config.mcp_server.port,
         )
     except Exception as e:
-        logger.error(f"Error starting MCP server: {e}")
+        logger.error("Error starting MCP server: %s", e)
         raise
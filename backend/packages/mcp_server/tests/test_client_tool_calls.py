@@ -0,0 +1,131 @@
+"""
+Unit tests for the MCP client's tool call and prompt helpers.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from mcp_server.client import MCPSessionCache, _collect_function_calls
+
+
+def _call(name, **args):
+    """A function call output item as returned by the Responses API."""
+    return SimpleNamespace(name=name, arguments=json.dumps(args))
+
+
+class TestCollectFunctionCalls:
+    """Test merging of create_transactions calls."""
+
+    def test_titled_calls_merged_per_group(self):
+        """Test that calls sharing a group title become one request."""
+        calls = _collect_function_calls(
+            [
+                _call(
+                    "create_transactions",
+                    group_title="Aldi",
+                    transactions=[{"amount": "1"}],
+                ),
+                _call(
+                    "create_transactions",
+                    group_title="Aldi",
+                    transactions=[{"amount": "2"}],
+                ),
+            ]
+        )
+
+        assert calls == [
+            {
+                "name": "create_transactions",
+                "args": {
+                    "group_title": "Aldi",
+                    "transactions": [
+                        {"amount": "1", "type": "withdrawal"},
+                        {"amount": "2", "type": "withdrawal"},
+                    ],
+                },
+            }
+        ]
+
+    def test_untitled_calls_not_merged(self):
+        """Test that calls without a group title stay separate transactions."""
+        calls = _collect_function_calls(
+            [
+                _call("create_transactions", transactions=[{"amount": "1"}]),
+                _call("create_transactions", transactions=[{"amount": "2"}]),
+            ]
+        )
+
+        assert [call["args"]["transactions"] for call in calls] == [
+            [{"amount": "1", "type": "withdrawal"}],
+            [{"amount": "2", "type": "withdrawal"}],
+        ]
+
+    def test_mixed_titled_and_untitled_calls(self):
+        """Test that only titled calls are merged, keeping the call order."""
+        calls = _collect_function_calls(
+            [
+                _call(
+                    "create_transactions",
+                    group_title="Aldi",
+                    transactions=[{"amount": "1"}],
+                ),
+                _call("create_transactions", transactions=[{"amount": "2"}]),
+                _call(
+                    "create_transactions",
+                    group_title="Coop",
+                    transactions=[{"amount": "3"}],
+                ),
+                _call(
+                    "create_transactions",
+                    group_title="Aldi",
+                    transactions=[{"amount": "4"}],
+                ),
+                _call("create_transactions", transactions=[{"amount": "5"}]),
+            ]
+        )
+
+        assert [
+            (
+                call["args"].get("group_title"),
+                [tx["amount"] for tx in call["args"]["transactions"]],
+            )
+            for call in calls
+        ] == [
+            ("Aldi", ["1", "4"]),
+            (None, ["2"]),
+            ("Coop", ["3"]),
+            (None, ["5"]),
+        ]
+
+    def test_other_tools_passed_through(self):
+        """Test that calls to other tools are returned unchanged."""
+        calls = _collect_function_calls([_call("get_accounts", type="asset")])
+
+        assert calls == [{"name": "get_accounts", "args": {"type": "asset"}}]
+
+
+class TestMCPSessionCacheGetPrompt:
+    """Test prompt fetching through the session cache."""
+
+    @pytest.mark.asyncio
+    async def test_arguments_json_encoded_and_cached(self):
+        """Test that non-string arguments are sent as JSON, once per value."""
+        requests = []
+
+        async def get_prompt(name, arguments=None):
+            requests.append((name, arguments))
+            return name
+
+        session = SimpleNamespace(get_prompt=get_prompt)
+        cache = MCPSessionCache(tools=None, prompts=None, resources=None, functions=[])
+        accounts = [{"id": "1", "name": "Cash"}]
+
+        await cache.get_prompt(session, "context", arguments={"accounts": accounts})
+        await cache.get_prompt(session, "context", arguments={"accounts": accounts})
+        await cache.get_prompt(session, "user", arguments={"note": "text"})
+
+        assert requests == [
+            ("context", {"accounts": '[{"id":"1","name":"Cash"}]'}),
+            ("user", {"note": "text"}),
+        ]
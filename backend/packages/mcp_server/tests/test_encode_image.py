@@ -1,6 +1,8 @@
-from mcp_server.client import encode_image_to_base64
+from mcp_server import client as client_module
+from mcp_server.client import encode_image_to_base64, receipt_image_input
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
 
 class TestEncodeImageToBase64:
@@ -40,3 +42,48 @@ class TestEncodeImageToBase64:
         # Act & Assert
         with pytest.raises(FileNotFoundError):
             encode_image_to_base64(nonexistent_path)
+
+    def test_encode_empty_file(self, tmp_path):
+        """Test that an empty file encodes to an empty string."""
+        image_path = tmp_path / "empty.jpg"
+        image_path.write_bytes(b"")
+
+        assert encode_image_to_base64(image_path) == ""
+
+
+class TestReceiptImageInput:
+
+    @pytest.mark.asyncio
+    async def test_image_sent_inline_when_uploads_disabled(self, tmp_path, monkeypatch):
+        """Test that the image becomes a base64 data URI without uploading."""
+        monkeypatch.setattr(client_module.config.openai, "upload_images", False)
+        image_path = tmp_path / "receipt.png"
+        image_path.write_bytes(b"receipt")
+
+        result = await receipt_image_input(image_path, openai_client=None)
+
+        assert result == {
+            "type": "input_image",
+            "image_url": "data:image/png;base64,cmVjZWlwdA==",
+        }
+
+    @pytest.mark.asyncio
+    async def test_image_uploaded_once_by_default(self, tmp_path, monkeypatch):
+        """Test that the image is uploaded and referenced by its file ID."""
+        monkeypatch.setattr(client_module.config.openai, "upload_images", True)
+        monkeypatch.setattr(client_module, "_uploaded_files", {})
+        image_path = tmp_path / "receipt.jpg"
+        image_path.write_bytes(b"receipt")
+        uploads = []
+
+        async def create(file, purpose):
+            uploads.append(file)
+            return SimpleNamespace(id="file-1")
+
+        openai_client = SimpleNamespace(files=SimpleNamespace(create=create))
+
+        first = await receipt_image_input(image_path, openai_client)
+        second = await receipt_image_input(image_path, openai_client)
+
+        assert first == second == {"type": "input_image", "file_id": "file-1"}
+        assert uploads == [("receipt.jpg", b"receipt")]
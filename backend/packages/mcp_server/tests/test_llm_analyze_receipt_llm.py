@@ -3,13 +3,40 @@ Integration tests for LLM-based receipt analysis functionality.
 These tests call the real OpenAI API to test actual LLM responses.
 """
 
+import asyncio
 import pytest
 import os
 
-from mcp import types
+from fastmcp import Client
+from openai import AsyncOpenAI
 
 # Import the functions we want to test
-from mcp_server.client import analyze_receipt, encode_image_to_base64
+from mcp_server.client import (
+    MCPSessionCache,
+    analyze_receipt,
+    convert_to_llm_tool,
+    receipt_image_input,
+)
+from mcp_server.server import mcp
+
+
+async def analyze_receipt_file(receipt_path, accounts):
+    """Analyze a receipt with the real OpenAI API and the in-memory MCP server."""
+    async with (
+        Client(mcp) as mcp_client,
+        AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"]) as openai_client,
+    ):
+        session = mcp_client.session
+        tools, prompts = await asyncio.gather(session.list_tools(), session.list_prompts())
+        cache = MCPSessionCache(
+            tools=tools,
+            prompts=prompts,
+            resources=None,
+            functions=[convert_to_llm_tool(tool) for tool in tools.tools],
+            accounts=accounts,
+        )
+        image_input = await receipt_image_input(receipt_path, openai_client)
+        return await analyze_receipt(image_input, accounts, session, cache, openai_client)
 
 
 class TestAnalyzeReceiptIntegration:
@@ -18,7 +45,7 @@ class TestAnalyzeReceiptIntegration:
     @pytest.fixture
     def sample_accounts(self):
         """Sample accounts list for testing."""
-        return [
+        names = [
             "Checking Account",
             "Cash",
             "Groceries",
@@ -31,46 +58,28 @@ class TestAnalyzeReceiptIntegration:
             "Transportation",
             "Unknown"
         ]
-    
-    @pytest.fixture
-    def sample_tools(self):
-        """Sample MCP tools for testing."""
         return [
-            types.Tool(
-                name="create_transaction",
-                description="Create a new transaction in Firefly III",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "transactions": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "description": {"type": "string"},
-                                    "amount": {"type": "number"},
-                                    "source_name": {"type": "string"},
-                                    "destination_name": {"type": "string"},
-                                    "date": {"type": "string"}
-                                }
-                            }
-                        }
-                    },
-                    "required": ["transactions"]
-                }
-            )
+            {"id": str(i), "name": name, "type": "asset" if i <= 2 else "expense"}
+            for i, name in enumerate(names, start=1)
         ]
     
+    def _get_receipt_path(self, testdata_dir, filename):
+        """Helper to get receipt file path."""
+        return testdata_dir / "photos" / "receipts" / filename
     
+    def _valid_accounts(self, accounts):
+        """Account names and IDs the LLM may reference, plus 'Unknown'."""
+        return {account["name"] for account in accounts} | {account["id"] for account in accounts} | {"Unknown"}
     
     @pytest.mark.api_cost
+    @pytest.mark.asyncio
     @pytest.mark.parametrize("receipt_filename,expected_line_items", [
         ("Aldi Groceries and Ski Gear.jpg", [19.99, 9.99, 19.99, 5.99, 3.29, 0.69, 4.99]),
         ("Apotheke Elotrans.jpg", [8.45]),
         ("Coop Wine and non-food.jpg", [15.20, 1.20]),
         ("Letzimarkt Meat and Chips.jpg", [3.95, 18.40 ,20.10]),
     ])
-    def test_analyze_receipt_real_llm(self, receipt_filename, expected_line_items, sample_accounts, sample_tools, testdata_dir):
+    async def test_analyze_receipt_real_llm(self, receipt_filename, expected_line_items, sample_accounts, testdata_dir):
         """
         Test analysis of receipts using real OpenAI API.
         
@@ -84,7 +93,6 @@ class TestAnalyzeReceiptIntegration:
             receipt_filename: The receipt image file to analyze
             expected_category: The expected category/account for this type of receipt
             sample_accounts: List of available accounts
-            sample_tools: MCP tools for transaction creation
             testdata_dir: Path to test data directory
         """
         # Skip if OpenAI API key is not available
@@ -97,10 +105,8 @@ class TestAnalyzeReceiptIntegration:
         if not receipt_path.exists():
             pytest.skip(f"Receipt file not found: {receipt_path}")
         
-        base64_image = encode_image_to_base64(receipt_path)
-        
         # Act
-        result = analyze_receipt(base64_image, sample_accounts, sample_tools)
+        result = await analyze_receipt_file(receipt_path, sample_accounts)
         
         # Assert basic structure
         assert isinstance(result, list), "Result should be a list"
@@ -110,7 +116,7 @@ class TestAnalyzeReceiptIntegration:
             first_result = result[0]
             assert 'name' in first_result, "Result should have 'name' field"
             assert 'args' in first_result, "Result should have 'args' field"
-            assert first_result['name'] == 'create_transaction', "Should call create_transaction function"
+            assert first_result['name'] == 'create_transactions', "Should call create_transactions function"
               # Verify transactions structure
             if 'transactions' in first_result['args']:
                 transactions = first_result['args']['transactions']
@@ -127,12 +133,11 @@ class TestAnalyzeReceiptIntegration:
                     # Verify transaction has basic required fields
                     assert 'description' in transaction, "Transaction should have description"
                     assert 'amount' in transaction, "Transaction should have amount"
-                    assert 'source_name' in transaction, "Transaction should have source_name"
-                    assert 'destination_name' in transaction, "Transaction should have destination_name"
+                    assert 'source_account' in transaction, "Transaction should have source_account"
+                    assert 'destination_account' in transaction, "Transaction should have destination_account"
                     
                     # Verify amount is a number and positive
-                    assert isinstance(transaction['amount'], (int, float)), "Amount should be numeric"
-                    assert transaction['amount'] > 0, "Amount should be positive"
+                    assert float(transaction['amount']) > 0, "Amount should be positive"
                     
                     # Collect actual amounts for comparison
                     actual_amounts.append(float(transaction['amount']))
@@ -141,9 +146,9 @@ class TestAnalyzeReceiptIntegration:
                     assert len(transaction['description'].strip()) > 0, "Description should not be empty"
                     
                     # Verify accounts are from the provided list or 'Unknown'
-                    valid_accounts = sample_accounts + ['Unknown']
-                    assert transaction['source_name'] in valid_accounts, f"Source account '{transaction['source_name']}' should be from available accounts"
-                    assert transaction['destination_name'] in valid_accounts, f"Destination account '{transaction['destination_name']}' should be from available accounts"
+                    valid_accounts = self._valid_accounts(sample_accounts)
+                    assert transaction['source_account'] in valid_accounts, f"Source account '{transaction['source_account']}' should be from available accounts"
+                    assert transaction['destination_account'] in valid_accounts, f"Destination account '{transaction['destination_account']}' should be from available accounts"
                 
                 # Verify that the extracted amounts match the expected line items
                 # Sort both lists to allow for different ordering
@@ -172,8 +177,8 @@ class TestAnalyzeReceiptIntegration:
                     print(f"\nTransaction {j+1}:")
                     print(f"  Description: {transaction.get('description', 'N/A')}")
                     print(f"  Amount: {transaction.get('amount', 'N/A')}")
-                    print(f"  Source: {transaction.get('source_name', 'N/A')}")
-                    print(f"  Destination: {transaction.get('destination_name', 'N/A')}")
+                    print(f"  Source: {transaction.get('source_account', 'N/A')}")
+                    print(f"  Destination: {transaction.get('destination_account', 'N/A')}")
                     print(f"  Type: {transaction.get('type', 'N/A')}")
                     if 'date' in transaction:
                         print(f"  Date: {transaction['date']}")
@@ -181,7 +186,8 @@ class TestAnalyzeReceiptIntegration:
         print(f"=== End Results for {receipt_filename} ===\n")
 
     @pytest.mark.api_cost
-    def test_analyze_receipt_with_empty_accounts(self, sample_tools, testdata_dir):
+    @pytest.mark.asyncio
+    async def test_analyze_receipt_with_empty_accounts(self, testdata_dir):
         """Test analyze_receipt with empty accounts list."""
         # Skip if OpenAI API key is not available
         if not os.getenv("OPENAI_API_KEY"):
@@ -193,11 +199,10 @@ class TestAnalyzeReceiptIntegration:
         if not receipt_path.exists():
             pytest.skip(f"Receipt file not found: {receipt_path}")
         
-        base64_image = encode_image_to_base64(receipt_path)
         empty_accounts = []
         
         # Act
-        result = analyze_receipt(base64_image, empty_accounts, sample_tools)
+        result = await analyze_receipt_file(receipt_path, empty_accounts)
         
         # Assert
         assert isinstance(result, list), "Result should be a list"
@@ -208,5 +213,5 @@ class TestAnalyzeReceiptIntegration:
         
         if len(result) > 0 and 'transactions' in result[0]['args']:
             for transaction in result[0]['args']['transactions']:
-                print(f"Transaction: {transaction.get('description')} -> {transaction.get('destination_name')}")
+                print(f"Transaction: {transaction.get('description')} -> {transaction.get('destination_account')}")
 
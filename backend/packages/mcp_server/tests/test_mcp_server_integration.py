@@ -1,8 +1,15 @@
-import json
-
+import orjson
 import pytest
+import pytest_asyncio
 from fastmcp import Client
-from mcp_server.server import get_firefly_client, mcp
+from firefly_client import AsyncFireflyClient
+from mcp_server.server import config, mcp
+
+
+async def call_tool_json(client, name, arguments):
+    """Call a tool and decode its JSON text result"""
+    content = await client.call_tool(name, arguments)
+    return orjson.loads(content[0].text)
 
 
 @pytest.fixture
@@ -10,7 +17,7 @@ def mcp_server():
     return mcp
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def transaction_cleanup():
     """Fixture to track and cleanup created transactions"""
     created_transaction_ids = []
@@ -19,10 +26,14 @@ async def transaction_cleanup():
 
     # Cleanup: delete all created transactions
     if created_transaction_ids:
-        with get_firefly_client() as client:
+        async with AsyncFireflyClient(
+            host=config.firefly.host,
+            access_token=config.firefly.access_token_value,
+            timeout=config.firefly.timeout,
+        ) as client:
             for transaction_id in created_transaction_ids:
                 try:
-                    client.delete_transaction(transaction_id)
+                    await client.delete_transaction(transaction_id)
                 except Exception as e:
                     # Log but don't fail test if cleanup fails
                     print(f"Failed to cleanup transaction {transaction_id}: {e}")
@@ -75,7 +86,7 @@ async def test_get_resource_accounts(mcp_server):
         for account in result:
             assert account.mimeType == "application/json"
 
-            accounts = json.loads(account.text)
+            accounts = orjson.loads(account.text)
             for account in accounts:
                 assert "id" in account
                 assert "name" in account
@@ -104,7 +115,8 @@ async def test_create_transactions_withdrawal(mcp_server, transaction_cleanup):
             }
         ]
 
-        result = await client.call_tool(
+        result = await call_tool_json(
+            client,
             "create_transactions",
             {"transactions": transactions, "group_title": "Test Grocery Shopping"},
         )
@@ -136,8 +148,8 @@ async def test_create_transactions_deposit(mcp_server, transaction_cleanup):
             }
         ]
 
-        result = await client.call_tool(
-            "create_transactions", {"transactions": transactions}
+        result = await call_tool_json(
+            client, "create_transactions", {"transactions": transactions}
         )
 
         assert isinstance(result, dict)
@@ -163,8 +175,8 @@ async def test_create_transactions_transfer(mcp_server, transaction_cleanup):
             }
         ]
 
-        result = await client.call_tool(
-            "create_transactions", {"transactions": transactions}
+        result = await call_tool_json(
+            client, "create_transactions", {"transactions": transactions}
         )
 
         assert isinstance(result, dict)
@@ -200,7 +212,8 @@ async def test_create_transactions_multiple_splits(mcp_server, transaction_clean
             },
         ]
 
-        result = await client.call_tool(
+        result = await call_tool_json(
+            client,
             "create_transactions",
             {"transactions": transactions, "group_title": "Shopping Trip"},
         )
@@ -228,8 +241,8 @@ async def test_create_transactions_invalid_type(mcp_server, transaction_cleanup)
             }
         ]
 
-        result = await client.call_tool(
-            "create_transactions", {"transactions": transactions}
+        result = await call_tool_json(
+            client, "create_transactions", {"transactions": transactions}
         )
 
         assert isinstance(result, dict)
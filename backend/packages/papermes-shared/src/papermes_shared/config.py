@@ -5,9 +5,24 @@ Uses pydantic-settings to load configuration from config.yml with environment va
 Supports hierarchical configuration loading from root and package-specific config files.
 """
 
+import hashlib
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Type
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+)
 
+import msgspec
+import yaml
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import (
     BaseSettings,
@@ -18,14 +33,270 @@ from pydantic_settings import (
     YamlConfigSettingsSource,
 )
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+
+class CachedYamlSource(YamlConfigSettingsSource):
+    """
+    YAML settings source that memoizes parsed files.
+
+    Parsed contents are keyed by file path and modification time, so repeated
+    configuration loads only re-read a file after it has changed on disk.
+    Files are parsed with libyaml's CSafeLoader when PyYAML provides it.
+
+    Parsed files are also stored as msgpack in the user's cache directory,
+    stamped with the source's modification time, so a fresh process can skip
+    YAML parsing until the file changes. Files that set a secret field are
+    never stored.
+    """
+
+    _cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def __init__(self, settings_cls: Type[BaseSettings], *args: Any, **kwargs: Any):
+        # The base class reads the files in __init__, before settings_cls is set
+        self._secret_paths = _secret_paths(settings_cls)
+        super().__init__(settings_cls, *args, **kwargs)
+
+    def _read_file(self, file_path: Path) -> Dict[str, Any]:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        key = (str(file_path), mtime_ns)
+        data = self._cache.get(key)
+        if data is None:
+            data = _load_compiled_yaml(file_path, mtime_ns)
+            if data is None:
+                with open(file_path, encoding=self.yaml_file_encoding) as yaml_file:
+                    data = yaml.load(yaml_file, Loader=YamlLoader) or {}
+                if not _sets_secret(data, self._secret_paths):
+                    _store_compiled_yaml(file_path, mtime_ns, data)
+            self._cache[key] = data
+        return data
+
+
+class _CompiledYaml(msgspec.Struct, array_like=True):
+    """Parsed YAML file contents, stamped with the source path and mtime."""
+
+    path: str
+    mtime_ns: int
+    data: Dict[str, Any]
+
+
+_COMPILED_YAML_ENCODER = msgspec.msgpack.Encoder()
+_COMPILED_YAML_DECODER = msgspec.msgpack.Decoder(_CompiledYaml)
+
+
+def _compiled_yaml_dir() -> Path:
+    """Directory of the compiled config files, outside any source tree."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "papermes" / "config"
+
+
+def _compiled_yaml_path(file_path: str) -> Path:
+    digest = hashlib.sha256(file_path.encode()).hexdigest()[:32]
+    return _compiled_yaml_dir() / f"{digest}.msgpack"
+
+
+def _load_compiled_yaml(file_path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Load the compiled YAML data if it was built from this version of the file."""
+    source = os.path.abspath(file_path)
+    try:
+        compiled = _COMPILED_YAML_DECODER.decode(
+            _compiled_yaml_path(source).read_bytes()
+        )
+    except (OSError, msgspec.DecodeError):
+        return None
+    if compiled.path != source or compiled.mtime_ns != mtime_ns:
+        return None
+    return compiled.data
+
+
+def _store_compiled_yaml(file_path: Path, mtime_ns: int, data: Dict[str, Any]):
+    """Store parsed YAML data in the cache directory; best effort only."""
+    source = os.path.abspath(file_path)
+    try:
+        content = _COMPILED_YAML_ENCODER.encode(_CompiledYaml(source, mtime_ns, data))
+    except (msgspec.EncodeError, TypeError):
+        return
+    # Values msgpack cannot represent exactly (dates, sets) are not cached
+    if _COMPILED_YAML_DECODER.decode(content).data != data:
+        return
+    compiled_path = _compiled_yaml_path(source)
+    tmp_path = compiled_path.with_name(f"{compiled_path.name}.{os.getpid()}.tmp")
+    try:
+        compiled_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, compiled_path)
+    except OSError:
+        # Without a writable cache directory the YAML is parsed every start
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _iter_secret_paths(
+    model: Type[BaseModel], prefix: Tuple[str, ...] = ()
+) -> Iterator[Tuple[str, ...]]:
+    for name, field in model.model_fields.items():
+        annotations = (field.annotation, *get_args(field.annotation))
+        if SecretStr in annotations:
+            yield (*prefix, name)
+        for annotation in annotations:
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                yield from _iter_secret_paths(annotation, (*prefix, name))
+
+
+@lru_cache(maxsize=None)
+def _secret_paths(model: Type[BaseModel]) -> FrozenSet[Tuple[str, ...]]:
+    """Key paths of the SecretStr fields of a model and its nested models."""
+    return frozenset(_iter_secret_paths(model))
+
+
+def _sets_secret(data: Dict[str, Any], paths: FrozenSet[Tuple[str, ...]]) -> bool:
+    """Whether the data sets any of the secret key paths (case-insensitive)."""
+    for path in paths:
+        node: Any = data
+        for key in path:
+            if not isinstance(node, dict):
+                break
+            node = next(
+                (value for name, value in node.items() if str(name).lower() == key),
+                None,
+            )
+        else:
+            if node is not None:
+                return True
+    return False
+
+
+class _DirectoryListings:
+    """Directory contents read with one os.scandir call per directory."""
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, os.DirEntry]] = {}
+
+    def entries(self, directory: str) -> Dict[str, os.DirEntry]:
+        listing = self._entries.get(directory)
+        if listing is None:
+            try:
+                with os.scandir(directory) as it:
+                    listing = {entry.name: entry for entry in it}
+            except OSError:
+                listing = {}
+            self._entries[directory] = listing
+        return listing
+
+    def exists(self, directory: str, name: str) -> bool:
+        return name in self.entries(directory)
+
+    def subdirectories(self, directory: str) -> List[str]:
+        # DirEntry.is_dir() uses the type from the listing, avoiding a stat
+        return [
+            entry.path for entry in self.entries(directory).values() if entry.is_dir()
+        ]
+
+
+def _ancestors(path: str) -> Tuple[str, ...]:
+    """Return path and each of its parents, nearest first, as strings."""
+    ancestors = [path]
+    parent = os.path.dirname(path)
+    while parent != path:
+        ancestors.append(parent)
+        path, parent = parent, os.path.dirname(parent)
+    return tuple(ancestors)
+
+
+def _find_config_file(
+    ancestors: Tuple[str, ...], filename: str, listings: _DirectoryListings
+) -> Tuple[str, ...]:
+    """Find config files (YAML or .env) following the same hierarchy logic."""
+    exists = listings.exists
+    join = os.path.join
+    current_dir = ancestors[0]
+    in_backend = os.path.basename(current_dir) == "backend"
+    config_files = []
+
+    # Find root backend file
+    backend_config = None
+
+    # Check if we're already in backend directory
+    if in_backend and exists(current_dir, filename):
+        backend_config = join(current_dir, filename)
+    else:
+        # Look for backend directory in parents
+        for parent in ancestors[1:]:
+            backend_dir = join(parent, "backend")
+            if exists(parent, "backend") and exists(backend_dir, filename):
+                backend_config = join(backend_dir, filename)
+                break
+
+    if backend_config:
+        config_files.append(backend_config)
+
+    # Find package-specific file
+    package_config = None
+
+    # First, try current directory and parents (the filesystem root excluded)
+    for search_dir in ancestors[:-1]:
+        if exists(search_dir, filename):
+            config_file = join(search_dir, filename)
+            if config_file != backend_config:
+                package_config = config_file
+                break
+
+    # If we're in backend root and didn't find a package config yet,
+    # look for package configs in packages/ subdirectory
+    if not package_config and in_backend:
+        packages_dir = join(current_dir, "packages")
+        for package_path in listings.subdirectories(packages_dir):
+            if exists(package_path, filename):
+                package_config = join(package_path, filename)
+                break
+
+    if package_config:
+        config_files.append(package_config)
+
+    return tuple(config_files)
+
+
+@lru_cache(maxsize=8)
+def find_config_files(
+    cwd: str, filenames: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Find the config files for each filename, searching from cwd.
+
+    All filenames are resolved in one walk: each directory is listed once and
+    the listing is shared between filenames. Results are cached per cwd until
+    reload_config() is called.
+
+    Returns:
+        One tuple of matching paths per filename, in the order given.
+    """
+    listings = _DirectoryListings()
+    ancestors = _ancestors(os.path.abspath(cwd))
+    return tuple(
+        _find_config_file(ancestors, filename, listings) for filename in filenames
+    )
+
 
 class OpenAIConfig(BaseModel):
     """OpenAI service configuration"""
 
-    api_key: SecretStr = ""
+    api_key: SecretStr = SecretStr("")
     model: str = "gpt-4.1"
     prompt_token_cost: float = 0.0000020
     completion_token_cost: float = 0.000008
+    upload_images: bool = True  # False sends images inline as base64 data URIs
+
+    @cached_property
+    def api_key_value(self) -> str:
+        """The API key as a plain string, unwrapped once"""
+        return self.api_key.get_secret_value()
 
 
 class AppConfig(BaseModel):
@@ -44,6 +315,30 @@ class FireflyConfig(BaseModel):
     access_token: Optional[SecretStr] = None
     timeout: int = 30  # seconds
 
+    @cached_property
+    def access_token_value(self) -> Optional[str]:
+        """The access token as a plain string, unwrapped once"""
+        if self.access_token is None:
+            return None
+        return self.access_token.get_secret_value()
+
+
+class HostAPIConfig(BaseModel):
+    """Host API server configuration"""
+
+    host: str = "0.0.0.0"
+    port: int = 8090
+    reload: bool = False  # development only
+    workers: Optional[int] = None  # opt-in worker processes; None runs one
+    log_level: str = "info"
+
+    @property
+    def worker_count(self) -> Optional[int]:
+        """Worker processes to run; None (single process) unless configured"""
+        if self.reload:
+            return None
+        return self.workers
+
 
 class BaseConfig(BaseSettings):
     """
@@ -69,6 +364,7 @@ class BaseConfig(BaseSettings):
     app: AppConfig = Field(default_factory=AppConfig)
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     firefly: FireflyConfig = Field(default_factory=FireflyConfig)
+    host_api: HostAPIConfig = Field(default_factory=HostAPIConfig)
 
     @classmethod
     def settings_customise_sources(
@@ -79,99 +375,29 @@ class BaseConfig(BaseSettings):
         dotenv_settings: DotEnvSettingsSource,
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> Tuple[PydanticBaseSettingsSource, ...]:
-        def find_config_files(filename: str):
-            """Find config files (YAML or .env) following the same hierarchy logic."""
-            config_files = []
-            current_dir = Path.cwd()
-
-            # Find root backend file
-            backend_config = None
-
-            # Check if we're already in backend directory
-            if (current_dir / filename).exists() and current_dir.name == "backend":
-                backend_config = current_dir / filename
-            else:
-                # Look for backend directory in parents
-                for parent in current_dir.parents:
-                    backend_dir = parent / "backend"
-                    if backend_dir.exists() and (backend_dir / filename).exists():
-                        backend_config = backend_dir / filename
-                        break
-
-            if backend_config:
-                config_files.append(str(backend_config))
-
-            # Find package-specific file
-            search_dir = current_dir
-            package_config = None
-
-            # First, try current directory and parents
-            while search_dir != search_dir.parent:
-                config_file = search_dir / filename
-                if (
-                    config_file.exists()
-                    and config_file != backend_config
-                    and str(config_file) not in config_files
-                ):
-                    package_config = config_file
-                    break
-                search_dir = search_dir.parent
-
-            # If we're in backend root and didn't find a package config yet,
-            # look for package configs in packages/ subdirectory
-            if not package_config and current_dir.name == "backend":
-                packages_dir = current_dir / "packages"
-                if packages_dir.exists():
-                    for package_path in packages_dir.iterdir():
-                        if package_path.is_dir():
-                            package_config_file = package_path / filename
-                            if package_config_file.exists():
-                                package_config = package_config_file
-                                break
-
-            if package_config:
-                config_files.append(str(package_config))
-
-            return config_files
-
-        # Build YAML config files
-        yaml_files = find_config_files("config.yml")
-
-        # Build .env files
-        env_files = find_config_files(".env")
-
-        # Create sources
-        yaml_source = (
-            YamlConfigSettingsSource(settings_cls, yaml_file=yaml_files)
-            if yaml_files
-            else None
-        )
-        dotenv_source = (
-            DotEnvSettingsSource(settings_cls, env_file=env_files)
-            if env_files
-            else dotenv_settings
-        )
-
-        return (
-            init_settings,
-            env_settings,
-            dotenv_source,
-            file_secret_settings,
-            yaml_source,
-        )
-
-
-# Global configuration instance
-config = BaseConfig()
-
-
+        # Build YAML and .env config files
+        yaml_files, env_files = find_config_files(os.getcwd(), ("config.yml", ".env"))
+
+        # Only create sources for files that exist, so deployments without
+        # config.yml or .env never try to open them. Parsed YAML is cached per
+        # file and mtime by CachedYamlSource.
+        sources = [init_settings, env_settings]
+        if env_files:
+            sources.append(DotEnvSettingsSource(settings_cls, env_file=env_files))
+        sources.append(file_secret_settings)
+        if yaml_files:
+            sources.append(CachedYamlSource(settings_cls, yaml_file=yaml_files))
+        return tuple(sources)
+
+
+@lru_cache(maxsize=1)
 def get_config() -> BaseConfig:
-    """Get the global configuration instance"""
-    return config
+    """Get the global configuration instance, loading it on first use"""
+    return BaseConfig()
 
 
 def reload_config() -> BaseConfig:
     """Reload configuration from file"""
-    global config
-    config = BaseConfig()
-    return config
+    find_config_files.cache_clear()
+    get_config.cache_clear()
+    return get_config()
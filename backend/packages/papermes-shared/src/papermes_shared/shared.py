@@ -1,7 +1,33 @@
 import ssl
+from functools import lru_cache
 
 import httpx
 import truststore
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-http_client = httpx.Client(verify=ssl_context)
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """SSL context backed by the system trust store, built on first use."""
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Process-wide synchronous HTTP client."""
+    return httpx.Client(verify=get_ssl_context())
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client for API SDKs.
+
+    Uses HTTP/2 and a keep-alive pool, so connections and TLS sessions are
+    reused across requests. The pool is bound to the event loop that first
+    uses it, so create one per loop (e.g. inside main()) and close it there.
+    """
+    return httpx.AsyncClient(
+        verify=get_ssl_context(),
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=32),
+    )
@@ -2,9 +2,35 @@
 Test configuration loading and validation.
 """
 
+import os
+
 import pytest
+from papermes_shared import config as config_module
 from papermes_shared.config import BaseConfig as Config
-from papermes_shared.config import get_config
+from papermes_shared.config import CachedYamlSource, HostAPIConfig
+from papermes_shared.config import find_config_files, get_config, reload_config
+
+
+@pytest.fixture(autouse=True)
+def config_cache_home(tmp_path, monkeypatch):
+    """Fixture that keeps compiled config files in a per-test cache directory."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def yaml_loads(monkeypatch):
+    """Fixture that records every stream parsed by yaml.load."""
+    calls = []
+    load = config_module.yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream)
+        return load(stream, Loader=Loader)
+
+    monkeypatch.setattr(config_module.yaml, "load", counting_load)
+    return calls
 
 
 class TestConfig:
@@ -16,6 +42,142 @@ class TestConfig:
         assert config is not None
         assert isinstance(config, Config)
 
+    def test_get_config_returns_singleton(self):
+        """Test that repeated calls return the same cached instance."""
+        assert get_config() is get_config()
+
+    def test_reload_config_rebuilds_instance(self):
+        """Test that reloading replaces the cached instance."""
+        config = get_config()
+        reloaded = reload_config()
+        assert reloaded is not config
+        assert get_config() is reloaded
+
+    def test_config_loads_without_config_files(self, tmp_path, monkeypatch):
+        """Test that file sources are skipped when no config files exist."""
+        monkeypatch.chdir(tmp_path)
+
+        sources = Config.settings_customise_sources(
+            Config, None, "env", "dotenv", "secrets"
+        )
+        assert sources == (None, "env", "secrets")
+
+        config = Config()
+        assert config.app.log_level == "INFO"
+
+    def test_config_rebuilt_after_file_change(self, tmp_path, monkeypatch):
+        """Test that a new config instance picks up an edited config file."""
+        monkeypatch.chdir(tmp_path)
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("app:\n  log_level: DEBUG\n", encoding="utf-8")
+
+        assert Config().app.log_level == "DEBUG"
+
+        yaml_file.write_text("app:\n  log_level: ERROR\n", encoding="utf-8")
+        os.utime(yaml_file, ns=(0, 0))
+
+        assert Config().app.log_level == "ERROR"
+
+    def test_host_api_single_process_by_default(self):
+        """Test that multiple worker processes are opt-in."""
+        assert HostAPIConfig().worker_count is None
+        assert HostAPIConfig(workers=4).worker_count == 4
+        assert HostAPIConfig(workers=4, reload=True).worker_count is None
+
+    def test_secrets_unwrapped_once(self):
+        """Test that secret values are exposed as cached plain strings."""
+        config = Config(openai={"api_key": "sk-test"}, firefly={"access_token": "tok"})
+
+        assert config.openai.api_key_value == "sk-test"
+        assert config.openai.api_key_value is config.openai.api_key_value
+        assert config.firefly.access_token_value == "tok"
+
+
+class TestCachedYamlSource:
+    """Test memoization of parsed YAML files."""
+
+    def test_yaml_file_parsed_once(self, tmp_path, yaml_loads):
+        """Test that an unchanged file is only parsed once."""
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("app:\n  log_level: DEBUG\n", encoding="utf-8")
+
+        first = CachedYamlSource(Config, yaml_file=str(yaml_file))()
+        second = CachedYamlSource(Config, yaml_file=str(yaml_file))()
+
+        assert first == second == {"app": {"log_level": "DEBUG"}}
+        assert len(yaml_loads) == 1
+
+    def test_compiled_copy_reused_across_processes(
+        self, tmp_path, monkeypatch, yaml_loads
+    ):
+        """Test that a fresh in-memory cache loads the msgpack copy instead."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        yaml_file = config_dir / "config.yml"
+        yaml_file.write_text("app:\n  log_level: DEBUG\n", encoding="utf-8")
+        CachedYamlSource(Config, yaml_file=str(yaml_file))()
+        monkeypatch.setattr(CachedYamlSource, "_cache", {})
+
+        data = CachedYamlSource(Config, yaml_file=str(yaml_file))()
+
+        assert data == {"app": {"log_level": "DEBUG"}}
+        assert len(yaml_loads) == 1
+        assert [path.name for path in config_dir.iterdir()] == ["config.yml"]
+
+    def test_compiled_copy_ignored_after_change(self, tmp_path, monkeypatch):
+        """Test that editing the YAML file invalidates the msgpack copy."""
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("app:\n  log_level: DEBUG\n", encoding="utf-8")
+        CachedYamlSource(Config, yaml_file=str(yaml_file))()
+
+        yaml_file.write_text("app:\n  log_level: ERROR\n", encoding="utf-8")
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        monkeypatch.setattr(CachedYamlSource, "_cache", {})
+
+        data = CachedYamlSource(Config, yaml_file=str(yaml_file))()
+
+        assert data == {"app": {"log_level": "ERROR"}}
+
+    def test_files_with_secrets_not_compiled(self, tmp_path, config_cache_home):
+        """Test that YAML files setting secret fields are never written out."""
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("OpenAI:\n  api_key: sk-test\n", encoding="utf-8")
+
+        CachedYamlSource(Config, yaml_file=str(yaml_file))()
+
+        assert not config_cache_home.exists()
+
+
+class TestFindConfigFiles:
+    """Test the hierarchical config file search."""
+
+    def test_finds_backend_and_package_files(self, tmp_path):
+        """Test that root and package files are found in one walk."""
+        backend = tmp_path / "backend"
+        package = backend / "packages" / "pkg"
+        package.mkdir(parents=True)
+        (backend / "config.yml").write_text("", encoding="utf-8")
+        (backend / ".env").write_text("", encoding="utf-8")
+        (package / "config.yml").write_text("", encoding="utf-8")
+
+        yaml_files, env_files = find_config_files(str(package), ("config.yml", ".env"))
+
+        assert yaml_files == (
+            str(backend / "config.yml"),
+            str(package / "config.yml"),
+        )
+        assert env_files == (str(backend / ".env"),)
+
+    def test_reload_clears_search_cache(self, tmp_path):
+        """Test that reload_config() forgets previous search results."""
+        find_config_files(str(tmp_path), ("config.yml",))
+        assert find_config_files.cache_info().currsize > 0
+
+        reload_config()
+
+        assert find_config_files.cache_info().hits == 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
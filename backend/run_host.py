@@ -3,15 +3,9 @@
 Script to run the Papermes Host API server
 """
 
-import sys
 import uvicorn
-from pathlib import Path
 
-# Add backend directory to Python path for config import
-backend_path = Path(__file__).parent
-sys.path.insert(0, str(backend_path))
-
-from config import get_config  # noqa: E402
+from papermes_shared.config import get_config
 
 # Get configuration
 config = get_config()
@@ -22,5 +16,6 @@ if __name__ == "__main__":
         host=config.host_api.host,
         port=config.host_api.port,
         reload=config.host_api.reload,
+        workers=config.host_api.worker_count,
         log_level=config.host_api.log_level
     )
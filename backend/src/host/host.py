@@ -1,29 +1,32 @@
-import sys
-import json
 import logging
-from pathlib import Path
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict
 
-# Add backend directory to path for config import
-backend_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_path))
-
-from config import get_config  # noqa: E402
+from papermes_shared.config import get_config
 
 # Get configuration
 config = get_config()
 
-# Configure logging using config
-logging.basicConfig(
-    level=getattr(logging, config.app.log_level),
-    format=config.app.log_format,
-    datefmt=config.app.log_date_format
-)
 logger = logging.getLogger(__name__)
 
+# Configure logging using config, once per process (reloads and workers
+# re-import this module and must not stack duplicate root handlers)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.getLevelNamesMapping()[config.app.log_level.upper()],
+        format=config.app.log_format,
+        datefmt=config.app.log_date_format
+    )
+
+# Block size used when streaming uploaded files
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Upper bound for the metadata form field; anything larger is rejected unparsed
+MAX_METADATA_LENGTH = 64 * 1024
+
 # FastAPI app instance
 app = FastAPI(
     title="Papermes Host API",
@@ -34,15 +37,19 @@ app = FastAPI(
 # Pydantic models for request/response
 class AnalysisResult(BaseModel):
     """Response model for file analysis results"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     filename: str
     file_size: int
     content_type: str
     metadata: Dict[str, Any]
-    analysis_status: str = Field(default="completed")
-    analysis_results: Optional[Dict[str, Any]] = Field(default=None)
+    analysis_status: str = "completed"
+    analysis_results: Optional[Dict[str, Any]] = None
 
 class ErrorResponse(BaseModel):
     """Error response model"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     error: str
     detail: Optional[str] = None
 
@@ -72,12 +79,23 @@ async def analyze_file(
         AnalysisResult: Results of the file analysis
     """
     try:
-        # Validate and parse metadata
+        # Validate and parse metadata, rejecting oversized or non-object
+        # payloads before they reach the JSON parser
+        if len(metadata) > MAX_METADATA_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid metadata format: exceeds {MAX_METADATA_LENGTH} characters"
+            )
+        if not metadata.lstrip().startswith("{"):
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid metadata format: Metadata must be a JSON object"
+            )
         try:
-            metadata_dict = json.loads(metadata)
+            metadata_dict = orjson.loads(metadata)
             if not isinstance(metadata_dict, dict):
                 raise ValueError("Metadata must be a JSON object")
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid metadata format: {str(e)}"
@@ -90,9 +108,14 @@ async def analyze_file(
                 detail="No file provided"
             )
         
-        # Read file content (for processing - in real implementation)
-        file_content = await file.read()
-        file_size = len(file_content)
+        # Starlette records the size while parsing the multipart body; only
+        # fall back to measuring the spooled file in blocks when it is unknown
+        file_size = file.size
+        if file_size is None:
+            file_size = 0
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+            await file.seek(0)
         
         logger.info(f"Analyzing file: {file.filename}, size: {file_size} bytes")
         logger.info(f"Metadata: {metadata_dict}")
@@ -137,4 +160,11 @@ async def http_exception_handler(request, exc):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8090, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "host:app",
+        host=config.host_api.host,
+        port=config.host_api.port,
+        reload=config.host_api.reload,
+        workers=config.host_api.worker_count,
+        log_level=config.host_api.log_level
+    )
\ No newline at end of file
@@ -9,12 +9,14 @@ Environment variables required:
 - OPENAI_API_KEY: Your OpenAI API key
 """
 
-import base64
+import asyncio
+import mmap
 import os
 from pathlib import Path
 
+import pybase64
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 
@@ -26,7 +28,15 @@ import truststore
 
 ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 
-http_client = httpx.Client(verify=ssl_context)
+# Images analyzed at the same time; more only queue up behind rate limits
+MAX_CONCURRENT_ANALYSES = 8
+
+# Load environment variables once, when the script starts
+load_dotenv()
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Image file suffixes picked up from testdata, matched case-insensitively
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
 
 gpt_prompt_pricing = 0.0000020
 # Cost per completion token
@@ -43,90 +53,113 @@ class ImageAnalysis(BaseModel):
 def encode_image_to_base64(image_path: Path) -> str:
     """Encode an image file to base64 string."""
     with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode('utf-8')
-
-
-def analyze_image_with_openai(image_path: Path, prompt: str = "What's in this image?") -> str:
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return ""  # an empty file cannot be mapped
+        # Encode straight from the mapped file, without reading it into bytes;
+        # pybase64 uses SIMD encoders where available
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image:
+            return pybase64.b64encode(image).decode('ascii')
+
+
+async def analyze_image_with_openai(
+    client: AsyncOpenAI,
+    analysis_slots: asyncio.Semaphore,
+    image_path: Path,
+    prompt: str = "What's in this image?",
+) -> str:
     """
     Send an image to OpenAI Responses API for structured analysis.
     
     Args:
+        client: OpenAI client shared by all images
+        analysis_slots: Semaphore bounding the concurrent analyses
         image_path: Path to the image file
         prompt: The question to ask about the image
         
     Returns:
         The structured API response or None if error
     """
-    # Load environment variables
-    load_dotenv()
-    
-    # Initialize OpenAI client
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("OPENAI_API_KEY environment variable not set")
-    
-    client = OpenAI(api_key=api_key, http_client=http_client)
-      # Encode image to base64
-    base64_image = encode_image_to_base64(image_path)
-    
-    
-    response = client.responses.create(
-        model="gpt-4.1",
-        input=[
-            {
-                "role": "user",
-                "content": [
-                    { "type": "input_text", "text": "what's in this image?" },
-                    {
-                        "type": "input_image",
-                        "image_url": f"data:image/jpeg;base64,{base64_image}",
-                    },
-                ],
-            }
-        ],
-    )
+    # Hold at most MAX_CONCURRENT_ANALYSES encoded images at a time
+    async with analysis_slots:
+        # Encode image to base64 in a worker thread, off the event loop
+        base64_image = await asyncio.to_thread(encode_image_to_base64, image_path)
+        response = await client.responses.create(
+            model="gpt-4.1",
+            input=[
+                {
+                    "role": "user",
+                    "content": [
+                        { "type": "input_text", "text": "what's in this image?" },
+                        {
+                            "type": "input_image",
+                            "image_url": f"data:image/jpeg;base64,{base64_image}",
+                        },
+                    ],
+                }
+            ],
+        )
     usage = response.usage.output_tokens * gpt_completion_pricing + response.usage.input_tokens * gpt_prompt_pricing
     print(f"Total USD burned: ${usage}")
     return response.output_text
         
-def main():
-    """Main function to run the receipt analysis."""
+async def main():
+    """Main function to run the receipt analysis on all testdata images."""
     # Find the testdata directory relative to this script
     script_dir = Path(__file__).parent
     testdata_dir = script_dir.parent.parent.parent / "testdata"
     
-    # Look for image files in testdata
-    image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff'}
-    image_files = []
-    
-    for ext in image_extensions:
-        image_files.extend(testdata_dir.rglob(f"*{ext}"))
-        image_files.extend(testdata_dir.rglob(f"*{ext.upper()}"))
+    # Look for image files in testdata, walking the tree once
+    image_files = [
+        path for path in testdata_dir.rglob("*")
+        if path.name.lower().endswith(IMAGE_EXTENSIONS)
+    ]
     
     if not image_files:
         print("No image files found in testdata directory")
         return
     
-    # Use the first image found
-    image_path = image_files[0]
-    print(f"Analyzing image: {image_path}")
-      # Analyze the image
-    result = analyze_image_with_openai(
-        image_path=image_path,
-        prompt="Analyze this image and provide a detailed description, list any objects you can detect, extract any text content, and rate your confidence level (high/medium/low)."
-    )
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY environment variable not set")
+    
+    print(f"Analyzing {len(image_files)} image(s)")
+    # The client's connection pool and the semaphore belong to this event
+    # loop, so they are created here; the pool is closed with the client
+    async with AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            verify=ssl_context,
+            limits=httpx.Limits(max_connections=MAX_CONCURRENT_ANALYSES),
+        ),
+    ) as client:
+        analysis_slots = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        # Analyze the images concurrently, bounded by MAX_CONCURRENT_ANALYSES
+        results = await asyncio.gather(
+            *(
+                analyze_image_with_openai(
+                    client,
+                    analysis_slots,
+                    image_path=image_path,
+                    prompt="Analyze this image and provide a detailed description, list any objects you can detect, extract any text content, and rate your confidence level (high/medium/low)."
+                )
+                for image_path in image_files
+            ),
+            return_exceptions=True,
+        )
     
-    if result:
+    for image_path, result in zip(image_files, results):
         print("\n" + "="*50)
-        print("OpenAI Responses API Analysis Result:")
+        print(f"OpenAI Responses API Analysis Result: {image_path}")
         print("="*50)
-        print(f"Description: {result}")
-        #print(f"Objects Detected: {', '.join(result.objects_detected)}")
-        #print(f"Text Content: {result.text_content}")
-        #print(f"Confidence Level: {result.confidence_level}")
-    else:
-        print("Failed to analyze image")
+        if isinstance(result, Exception):
+            print(f"Failed to analyze image: {result}")
+        elif result:
+            print(f"Description: {result}")
+            #print(f"Objects Detected: {', '.join(result.objects_detected)}")
+            #print(f"Text Content: {result.text_content}")
+            #print(f"Confidence Level: {result.confidence_level}")
+        else:
+            print("Failed to analyze image")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
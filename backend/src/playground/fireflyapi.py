@@ -1,13 +1,7 @@
 import asyncio
-import sys
-from pathlib import Path
 from pyfirefly import Firefly
 
-# Add backend directory to path for config import
-backend_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(backend_path))
-
-from config import get_config  # noqa: E402
+from papermes_shared.config import get_config
 
 # Get configuration
 config = get_config()
@@ -8,6 +8,15 @@ import json
 import asyncio
 from pathlib import Path
 
+ANALYZE_URL = "http://localhost:8090/analyze_file"
+
+def post_receipt(image_path: Path, metadata: dict) -> httpx.Response:
+    """Stream the image from an open file to the analyze endpoint"""
+    with httpx.Client(timeout=30.0) as client, image_path.open("rb") as image_file:
+        files = {"file": (image_path.name, image_file, "image/jpeg")}
+        data = {"metadata": json.dumps(metadata)}
+        return client.post(ANALYZE_URL, files=files, data=data)
+
 async def upload_receipt_to_host_api():
     """Upload the Shopping Aldi receipt to the host API"""
     
@@ -34,39 +43,31 @@ async def upload_receipt_to_host_api():
     print(f"Metadata: {json.dumps(metadata, indent=2)}")
     
     # Make request to the API
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            # Open and upload the file
-            with open(image_path, "rb") as f:
-                files = {"file": (image_path.name, f, "image/jpeg")}
-                data = {"metadata": json.dumps(metadata)}
-                
-                print("\nSending request to http://localhost:8090/analyze_file...")
-                response = await client.post(
-                    "http://localhost:8090/analyze_file",
-                    files=files,
-                    data=data
-                )
-            
-            print(f"\n✅ Response Status: {response.status_code}")
+    try:
+        print(f"\nSending request to {ANALYZE_URL}...")
+        # Upload in a worker thread, so the file is read in chunks while it
+        # is sent without blocking the event loop
+        response = await asyncio.to_thread(post_receipt, image_path, metadata)
+        
+        print(f"\n✅ Response Status: {response.status_code}")
+        
+        if response.status_code == 200:
+            result = response.json()
+            print("✅ Upload successful!")
+            print(f"📄 Filename: {result['filename']}")
+            print(f"📊 File size: {result['file_size']} bytes")
+            print(f"🔍 Content type: {result['content_type']}")
+            print(f"📋 Analysis status: {result['analysis_status']}")
+            print(f"🔬 Analysis results: {json.dumps(result['analysis_results'], indent=2)}")
+        else:
+            print(f"❌ Upload failed: {response.text}")
             
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Upload successful!")
-                print(f"📄 Filename: {result['filename']}")
-                print(f"📊 File size: {result['file_size']} bytes")
-                print(f"🔍 Content type: {result['content_type']}")
-                print(f"📋 Analysis status: {result['analysis_status']}")
-                print(f"🔬 Analysis results: {json.dumps(result['analysis_results'], indent=2)}")
-            else:
-                print(f"❌ Upload failed: {response.text}")
-                
-        except httpx.ConnectError:
-            print("❌ Error: Could not connect to the host API server.")
-            print("💡 Make sure the server is running on http://localhost:8090")
-            print("   You can start it with: 'Run Host API Only' launch configuration")
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    except httpx.ConnectError:
+        print("❌ Error: Could not connect to the host API server.")
+        print("💡 Make sure the server is running on http://localhost:8090")
+        print("   You can start it with: 'Run Host API Only' launch configuration")
+    except Exception as e:
+        print(f"❌ Error: {e}")
 
 async def test_health_endpoint():
     """Test the health check endpoint"""